@@ -6,6 +6,7 @@ Provides integrations with external APIs including Google Books and OpenAI.
 Key Classes:
     GoogleBooksAPI: Interface to Google Books API for book search
     AIRecommendationEngine: AI-powered recommendations using OpenAI
+    BatchFailedError: Raised when a queued OpenAI batch job ends without an answer
 
 Key Functions:
     retry_on_failure: Decorator for automatic retry with exponential backoff
@@ -21,6 +22,6 @@ Usage:
 """
 
 from .google_books import GoogleBooksAPI
-from .openai_engine import AIRecommendationEngine, retry_on_failure
+from .openai_engine import AIRecommendationEngine, BatchFailedError, retry_on_failure
 
-__all__ = ["GoogleBooksAPI", "AIRecommendationEngine", "retry_on_failure"]
+__all__ = ["GoogleBooksAPI", "AIRecommendationEngine", "BatchFailedError", "retry_on_failure"]
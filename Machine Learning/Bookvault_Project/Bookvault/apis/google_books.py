@@ -1,3 +1,5 @@
+import asyncio
+import aiohttp
 import requests
 import time
 from typing import List, Dict
@@ -9,11 +11,37 @@ from ..logger import get_logger
 logger = get_logger(__name__)
 
 
+VOLUMES_URL = "https://www.googleapis.com/books/v1/volumes"
+
+
 class GoogleBooksAPI:
     def __init__(self, cache: CacheProvider):
         self.cache = cache
         self.api_key = Config.GOOGLE_BOOKS_API
 
+    def _build_params(self, query: str, max_results: int, lang: str, start_index: int) -> Dict:
+        params = {"q": query, "maxResults": min(max_results, Config.MAX_SEARCH_RESULTS), "langRestrict": lang}
+        if start_index > 0:
+            params["startIndex"] = start_index
+        if self.api_key:
+            params["key"] = self.api_key
+        return params
+
+    @staticmethod
+    def _parse_items(items: List[Dict]) -> List[Dict]:
+        logger.debug(f"Received {len(items)} items from Google Books API")
+
+        books = []
+        for item in items:
+            book = Book.from_google_api(item)
+            # Only include books with valid cover images
+            cover_url = getattr(book, 'cover_url', '')
+            if cover_url and cover_url.strip() and len(cover_url) > 10:  # Must have actual URL
+                books.append(book.to_dict())
+
+        logger.info(f"Processed {len(books)} valid books (with covers) from {len(items)} items")
+        return books
+
     def search(self, query: str, max_results: int = 20, lang: str = "en", start_index: int = 0) -> List[Dict]:
         cache_key = f"search:{query}:{lang}:{max_results}:{start_index}"
         if cached := self.cache.get(cache_key):
@@ -25,27 +53,11 @@ class GoogleBooksAPI:
         retry_count = 0
         while retry_count < Config.MAX_RETRIES:
             try:
-                params = {"q": query, "maxResults": min(max_results, Config.MAX_SEARCH_RESULTS), "langRestrict": lang}
-                if start_index > 0:
-                    params["startIndex"] = start_index
-                if self.api_key:
-                    params["key"] = self.api_key
-
-                res = requests.get("https://www.googleapis.com/books/v1/volumes", params=params, timeout=Config.TIMEOUT)
+                params = self._build_params(query, max_results, lang, start_index)
+                res = requests.get(VOLUMES_URL, params=params, timeout=Config.TIMEOUT)
                 res.raise_for_status()
 
-                books = []
-                items = res.json().get("items", [])
-                logger.debug(f"Received {len(items)} items from Google Books API")
-
-                for item in items:
-                    book = Book.from_google_api(item)
-                    # Only include books with valid cover images
-                    cover_url = getattr(book, 'cover_url', '')
-                    if cover_url and cover_url.strip() and len(cover_url) > 10:  # Must have actual URL
-                        books.append(book.to_dict())
-
-                logger.info(f"Processed {len(books)} valid books (with covers) from {len(items)} items")
+                books = self._parse_items(res.json().get("items", []))
                 self.cache.set(cache_key, books)
                 return books
 
@@ -99,3 +111,50 @@ class GoogleBooksAPI:
                 return []
 
         return []
+
+    async def async_search(self, session: aiohttp.ClientSession, query: str, max_results: int = 20,
+                           lang: str = "en", start_index: int = 0) -> List[Dict]:
+        """Non-blocking variant of search() for fanning out several requests at once"""
+        cache_key = f"search:{query}:{lang}:{max_results}:{start_index}"
+        if cached := self.cache.get(cache_key):
+            logger.debug(f"Cache hit for query: {query[:50]}")
+            return cached
+
+        logger.info(f"Google Books API async search: query='{query[:50]}', max_results={max_results}, start_index={start_index}")
+
+        params = self._build_params(query, max_results, lang, start_index)
+        for retry_count in range(1, Config.MAX_RETRIES + 1):
+            try:
+                async with session.get(VOLUMES_URL, params=params) as res:
+                    if res.status == 429:
+                        if retry_count >= Config.MAX_RETRIES:
+                            logger.error(f"Google Books API rate limit - failed after {Config.MAX_RETRIES} retries")
+                            return []
+                        # Exponential backoff: 2s, 4s, 8s
+                        backoff_time = 2 ** retry_count
+                        logger.warning(f"Google Books API rate limit (429) - waiting {backoff_time}s before retry {retry_count}/{Config.MAX_RETRIES}")
+                        await asyncio.sleep(backoff_time)
+                        continue
+                    res.raise_for_status()
+                    data = await res.json()
+
+                books = self._parse_items(data.get("items", []))
+                self.cache.set(cache_key, books)
+                return books
+
+            except asyncio.TimeoutError:
+                logger.warning(f"Google Books API timeout (attempt {retry_count}/{Config.MAX_RETRIES})")
+                if retry_count >= Config.MAX_RETRIES:
+                    logger.error(f"Google Books API failed after {Config.MAX_RETRIES} retries")
+                    return []
+                await asyncio.sleep(1)
+
+            except aiohttp.ClientError as e:
+                logger.error(f"Google Books API request error: {e}")
+                return []
+
+            except Exception as e:
+                logger.error(f"Google Books API unexpected error: {e}", exc_info=True)
+                return []
+
+        return []
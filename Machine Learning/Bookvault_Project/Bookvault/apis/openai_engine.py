@@ -15,6 +15,7 @@ Key Features:
 
 Classes:
     AIRecommendationEngine: Main class for all AI-powered features
+    BatchFailedError: Raised when a queued batch job ends without an answer
 
 Functions:
     retry_on_failure: Decorator for automatic retry with exponential backoff
@@ -33,9 +34,10 @@ Usage:
 """
 
 import hashlib
+import json
 import time
 from functools import lru_cache, wraps
-from typing import List, Dict, Callable, Any
+from typing import List, Dict, Callable, Any, Optional
 from openai import OpenAI, APIError, RateLimitError, APIConnectionError
 from ..config import Config
 from ..cache import SQLiteCache
@@ -80,6 +82,10 @@ def retry_on_failure(max_retries: int = 3, delay: float = 1.0, backoff: float =
     return decorator
 
 
+class BatchFailedError(Exception):
+    """A Batch API job reached a terminal status (failed, expired, cancelled) without an answer"""
+
+
 class AIRecommendationEngine:
     """
     AI-Powered Book Recommendation and Content Generation Engine
@@ -95,6 +101,8 @@ class AIRecommendationEngine:
 
     Methods:
         verify_books_batch: Verify if books match a specific genre using AI
+        submit_genre_verification_batch: Queue genre verification via the Batch API
+        get_batch_answer: Poll a queued batch job for its answer
         get_recommendations: Get book recommendations similar to a given book
         get_captions: Generate catchy captions for a book
         get_famous_quotes: Generate thematic quotes inspired by a book
@@ -137,39 +145,134 @@ class AIRecommendationEngine:
         if not books:
             return []
 
+        prompt = self._genre_verification_prompt(books, expected_genre)
+
+        try:
+            resp = self.client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=150,
+                temperature=0
+            )
+            answer = resp.choices[0].message.content.strip()
+            return self.parse_genre_verification(answer, books)
+
+        except Exception as e:
+            logger.warning(f"Batch genre verification failed: {e}")
+            # On error, accept all books
+            return books
+
+    @staticmethod
+    def _genre_verification_prompt(books: List[Dict], expected_genre: str) -> str:
+        """Build the title/author genre verification prompt"""
         # Build batch prompt with just titles (much faster, no need for categories or covers)
         books_list = "\n".join([
             f"{i+1}. '{book.get('title', '')}' by {book.get('author', 'Unknown')}"
             for i, book in enumerate(books[:30])  # Can handle more books now (30)
         ])
 
-        prompt = (
+        return (
             f"Which books are '{expected_genre}' genre? Return ONLY comma-separated numbers (e.g., '1,3,5').\n\n"
             f"{books_list}"
         )
 
+    @staticmethod
+    def parse_genre_verification(answer: str, books: List[Dict]) -> List[Dict]:
+        """
+        Map a genre verification answer ("1,3,5") back to the matching books
+
+        Args:
+            answer: Raw model answer with comma-separated 1-based indices
+            books: The books the prompt was built from
+
+        Returns:
+            List of books that match the genre (all books if parsing fails)
+        """
         try:
-            resp = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=150,
-                temperature=0
+            valid_indices = [int(x.strip()) - 1 for x in answer.replace(' ', '').split(',') if x.strip().isdigit()]
+            return [books[i] for i in valid_indices if 0 <= i < len(books)]
+        except:
+            # If parsing fails, return all books (don't reject due to parsing error)
+            logger.warning(f"Failed to parse batch verification response: {answer}")
+            return books
+
+    def submit_genre_verification_batch(self, books: List[Dict], expected_genre: str) -> Optional[str]:
+        """
+        Queue genre verification through the OpenAI Batch API
+
+        Batch jobs cost half as much and draw on a separate rate-limit pool,
+        which suits non-interactive enrichment of genre listings.
+
+        Args:
+            books: List of book dictionaries with title, author
+            expected_genre: The genre we expect (Fiction, Mystery, etc.)
+
+        Returns:
+            Batch ID to poll with get_batch_answer, or None if submission failed
+        """
+        if not books:
+            return None
+
+        request = {
+            "custom_id": f"genre-{expected_genre}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": "gpt-4o-mini",
+                "messages": [{"role": "user", "content": self._genre_verification_prompt(books, expected_genre)}],
+                "max_tokens": 150,
+                "temperature": 0
+            }
+        }
+
+        try:
+            batch_file = self.client.files.create(
+                file=("genre_verification.jsonl", (json.dumps(request) + "\n").encode()),
+                purpose="batch"
             )
-            answer = resp.choices[0].message.content.strip()
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info(f"Submitted genre verification batch for [{expected_genre}]: {batch.id}")
+            return batch.id
+        except Exception as e:
+            logger.warning(f"Genre verification batch submission failed: {e}")
+            return None
+
+    def get_batch_answer(self, batch_id: str) -> Optional[str]:
+        """
+        Fetch the answer of a single-request batch job
+
+        Args:
+            batch_id: ID returned by submit_genre_verification_batch
 
-            # Parse response to get book indices
-            try:
-                valid_indices = [int(x.strip()) - 1 for x in answer.replace(' ', '').split(',') if x.strip().isdigit()]
-                return [books[i] for i in valid_indices if 0 <= i < len(books)]
-            except:
-                # If parsing fails, return all books (don't reject due to parsing error)
-                logger.warning(f"Failed to parse batch verification response: {answer}")
-                return books
+        Returns:
+            The model answer, or None while the batch is still running or could not be read
 
+        Raises:
+            BatchFailedError: If the batch ended without an answer and will never produce one
+        """
+        try:
+            batch = self.client.batches.retrieve(batch_id)
         except Exception as e:
-            logger.warning(f"Batch genre verification failed: {e}")
-            # On error, accept all books
-            return books
+            logger.warning(f"Could not read batch {batch_id}: {e}")
+            return None
+
+        if batch.status in ("failed", "expired", "cancelling", "cancelled") or (
+                batch.status == "completed" and not batch.output_file_id):
+            raise BatchFailedError(f"Batch {batch_id} ended with status '{batch.status}'")
+        if batch.status != "completed":
+            return None
+
+        try:
+            output = self.client.files.content(batch.output_file_id).text
+            result = json.loads(output.splitlines()[0])
+            return result["response"]["body"]["choices"][0]["message"]["content"].strip()
+        except Exception as e:
+            logger.warning(f"Could not read batch {batch_id}: {e}")
+            return None
 
     def _generate_cache_key(self, prompt: str) -> str:
         return f"ai:{hashlib.md5(prompt.encode()).hexdigest()}"
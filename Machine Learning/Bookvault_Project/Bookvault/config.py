@@ -33,7 +33,7 @@ Environment Variables:
         BOOKS_PER_PAGE_INITIAL: Initial books to display (default: 12)
         BOOKS_PER_LOAD_MORE: Books to add per "Load More" click (default: 6)
         MAX_BOOKS_PER_GENRE: Maximum books per genre (default: 48)
-        GENRE_API_DELAY_SECONDS: Delay between genre API calls (default: 5)
+        BATCH_GENRE_VERIFICATION: Verify genre listings via the OpenAI Batch API (default: false)
 
 Usage:
     from Bookvault.config import Config
@@ -123,7 +123,7 @@ class Config:
     BOOKS_PER_PAGE_INITIAL = int(os.getenv("BOOKS_PER_PAGE_INITIAL", "12"))
     BOOKS_PER_LOAD_MORE = int(os.getenv("BOOKS_PER_LOAD_MORE", "6"))
     MAX_BOOKS_PER_GENRE = int(os.getenv("MAX_BOOKS_PER_GENRE", "48"))
-    GENRE_API_DELAY_SECONDS = int(os.getenv("GENRE_API_DELAY_SECONDS", "5"))
+    BATCH_GENRE_VERIFICATION = os.getenv("BATCH_GENRE_VERIFICATION", "false").lower() == "true"
 
     # Rate Limiting
     RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
@@ -17,6 +17,8 @@ Usage:
     random_start = SearchConstants.RANDOM_START_RANGE
 """
 
+import re
+
 
 class GenreConstants:
     """Constants related to genre browsing and book fetching"""
@@ -53,6 +55,12 @@ class SearchConstants:
     # Minimum query length for natural language processing
     MIN_QUERY_LENGTH = 3
 
+    # Keywords marking a natural language request (one C-level scan per query)
+    NL_QUERY_PATTERN = re.compile(
+        r'\b(?:about|books|novel|read|want|looking for|recommend|like|similar to)\b',
+        re.IGNORECASE
+    )
+
 
 class UIConstants:
     """Constants related to UI display and layout"""
@@ -25,6 +25,9 @@ class InputValidator:
     MAX_DESCRIPTION_LENGTH = 5000
     MAX_TITLE_LENGTH = 300
 
+    # Deletion table for control characters (everything below 0x20 except newline)
+    CONTROL_CHARS_TABLE = dict.fromkeys(c for c in range(32) if c != ord('\n'))
+
     @staticmethod
     def sanitize_string(input_str: str, max_length: int = None) -> str:
         """
@@ -47,7 +50,7 @@ class InputValidator:
         sanitized = html.escape(sanitized)
 
         # Remove control characters
-        sanitized = ''.join(char for char in sanitized if ord(char) >= 32 or char == '\n')
+        sanitized = sanitized.translate(InputValidator.CONTROL_CHARS_TABLE)
 
         # Truncate if needed
         if max_length and len(sanitized) > max_length:
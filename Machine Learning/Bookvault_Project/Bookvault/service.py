@@ -1,4 +1,6 @@
-from typing import List, Dict, Optional, Any
+import asyncio
+import aiohttp
+from typing import List, Dict, Optional, Any, Tuple
 from .config import Config
 from .cache import SQLiteCache
 from .apis import GoogleBooksAPI, AIRecommendationEngine
@@ -47,13 +49,20 @@ class BookVaultService:
         self._initialized = True
         logger.info("BookVaultService initialized successfully")
 
-    def search_books(self, query: str, max_results: int = 20, lang: str = "en", start_index: int = 0, verify_genre: bool = False, expected_genre: str = "") -> List[Dict]:
+    @staticmethod
+    def _prepare_query(query: str) -> Optional[str]:
+        """
+        Validate, sanitize and rate-limit a search query
+
+        Returns:
+            The sanitized query, or None if it was rejected
+        """
         # Validate input
         if Config.ENABLE_INPUT_VALIDATION:
             is_valid, error_msg = InputValidator.validate_search_query(query)
             if not is_valid:
                 logger.warning(f"Invalid search query: {error_msg}")
-                return []
+                return None
 
         # Sanitize query
         query = InputValidator.sanitize_string(query, InputValidator.MAX_QUERY_LENGTH)
@@ -63,7 +72,14 @@ class BookVaultService:
             is_allowed, limit_msg = search_rate_limiter.is_allowed("global")
             if not is_allowed:
                 logger.warning(f"Search rate limit exceeded: {limit_msg}")
-                return []
+                return None
+
+        return query
+
+    def search_books(self, query: str, max_results: int = 20, lang: str = "en", start_index: int = 0, verify_genre: bool = False, expected_genre: str = "") -> List[Dict]:
+        query = self._prepare_query(query)
+        if query is None:
+            return []
 
         logger.info(f"Searching books: query='{query[:50]}', max_results={max_results}")
         books = self.books_api.search(query, max_results, lang, start_index)
@@ -83,6 +99,45 @@ class BookVaultService:
         # No verification - just filter for images
         return filter_books_with_images(books)
 
+    def search_books_concurrently(self, queries: List[Tuple[str, int]], max_results: int = 20,
+                                  lang: str = "en", concurrency: int = 6) -> List[List[Dict]]:
+        """
+        Run several Google Books searches in parallel
+
+        Args:
+            queries: List of (query, start_index) pairs
+            max_results: Maximum results per query
+            lang: Language code
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            One list of books per query, in the same order as queries
+        """
+        return asyncio.run(self._gather_searches(queries, max_results, lang, concurrency))
+
+    async def _gather_searches(self, queries: List[Tuple[str, int]], max_results: int,
+                               lang: str, concurrency: int) -> List[List[Dict]]:
+        # Semaphore keeps us within Google Books QPS instead of sleeping between calls
+        semaphore = asyncio.Semaphore(concurrency)
+        timeout = aiohttp.ClientTimeout(total=Config.TIMEOUT)
+
+        async def run_one(session: aiohttp.ClientSession, query: str, start_index: int) -> List[Dict]:
+            query = self._prepare_query(query)
+            if query is None:
+                return []
+
+            async with semaphore:
+                books = await self.books_api.async_search(session, query, max_results, lang, start_index)
+            return filter_books_with_images(books)
+
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            results = await asyncio.gather(
+                *(run_one(session, query, start_index) for query, start_index in queries),
+                return_exceptions=True
+            )
+
+        return [[] if isinstance(result, Exception) else result for result in results]
+
     def search_with_ai(self, query: str, max_results: int = 20, lang: str = "en") -> Dict:
         """
         Smart search that can handle both regular queries and natural language requests
@@ -3,10 +3,12 @@ BookVault Pro - AI-Powered Book Discovery Platform
 Modern redesign with dark theme and modular architecture
 """
 
+import itertools
+import re
 import sys
 sys.path.insert(0, ".")
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import streamlit as st
 from Bookvault.service import BookVaultService
 from Bookvault_UI.Components.styles import get_global_styles
@@ -24,12 +26,25 @@ def get_service() -> BookVaultService:
     return BookVaultService()
 
 
+@st.cache_resource
+def get_search_ai():
+    """Get or create search intelligence instance (cached across reruns)"""
+    from Bookvault.search_intelligence import SearchIntelligence
+    return SearchIntelligence()
+
+
 def cached_search_books(query: str, max_results: int = 20, lang: str = "en", start_index: int = 0, cache_key: str = "", verify_genre: bool = False, expected_genre: str = ""):
     """Search books - SQLite cache handles caching at service layer"""
     service = get_service()
     return service.search_books(query, max_results, lang, start_index, verify_genre, expected_genre)
 
 
+def parallel_search_books(queries: List[Tuple[str, int]], max_results: int = 20, lang: str = "en"):
+    """Run several searches concurrently - SQLite cache handles caching at service layer"""
+    service = get_service()
+    return service.search_books_concurrently(queries, max_results, lang)
+
+
 @st.cache_data(ttl=7200, show_spinner=False)
 def cached_ai_recommendations(title: str, author: str, description: str, categories: str, lang: str = "en", max_results: int = 5):
     """Cached wrapper for AI recommendations (2 hours TTL)"""
@@ -37,6 +52,31 @@ def cached_ai_recommendations(title: str, author: str, description: str, categor
     return service.get_similar_books_ai(title, author, description, categories, lang, max_results)
 
 
+@st.cache_data(ttl=3600, max_entries=500, show_spinner=False)
+def _cached_ai_book_recommendations(user_query: str, cache_key: str) -> List[Dict]:
+    from Bookvault.utils.ai_helpers import get_ai_book_recommendations
+
+    return get_ai_book_recommendations(
+        user_query=user_query,
+        search_function=cached_search_books,
+        max_results=24,
+        cache_key=cache_key
+    )
+
+
+def cached_ai_book_recommendations(user_query: str, cache_key: str = "") -> List[Dict]:
+    """Natural language book recommendations (1 hour TTL, keyed on the normalized query)"""
+    normalized = re.sub(r"\s+", " ", user_query.lower().strip())
+    return _cached_ai_book_recommendations(normalized, cache_key)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_batch_answer(batch_id: str) -> Optional[str]:
+    """Poll an OpenAI batch job at most once every 5 minutes"""
+    service = get_service()
+    return service.ai_engine.get_batch_answer(batch_id)
+
+
 # ============================================================================
 # STATE MANAGEMENT
 # ============================================================================
@@ -388,12 +428,10 @@ class BookVaultApp:
                     st.rerun()
 
             # Display in grid
-            st.markdown('<div class="book-grid">', unsafe_allow_html=True)
-            cols = st.columns(6)
+            col_cycle = itertools.cycle(st.columns(6))
             for idx, book in enumerate(results):
-                with cols[idx % 6]:
+                with next(col_cycle):
                     modern_book_card.render(book, f"search_{idx}")
-            st.markdown('</div>', unsafe_allow_html=True)
 
         else:
             # No results found - show helpful suggestions
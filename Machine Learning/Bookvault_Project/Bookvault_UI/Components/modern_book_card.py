@@ -4,41 +4,15 @@ Modern book card component - clickable image cards
 import streamlit as st
 from urllib.parse import quote
 
+# Escape table for book fields interpolated into card HTML
+_HTML_TRANS = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
 
-def render(book: dict, unique_id: str):
-    """
-    Render a modern book card as a clickable HTML container
-
-    Args:
-        book: dict with 'title', 'author', 'cover_url'
-        unique_id: unique identifier for the card
-    """
-    cover_url = book.get("cover_url", "")
-    title = book.get("title", "Unknown Title")
-    author = book.get("author", "Unknown Author")
-
-    if not cover_url:
-        return
-
-    # Create a unique book identifier
-    book_id = book.get("id") or f"{title}_{author}"
-
-    # Store book in session state with the ID as key (persistent storage)
-    if "all_books" not in st.session_state:
-        st.session_state.all_books = {}
-    st.session_state.all_books[book_id] = book
-
-    # URL-encode the book_id
-    encoded_book_id = quote(book_id, safe='')
-
-    # Truncate long titles and authors
-    display_title = title[:35] + '...' if len(title) > 35 else title
-    display_author = author[:25] + '...' if len(author) > 25 else author
-
-    # Create clickable card using HTML anchor tag (like friend's movie app)
-    card_html = f"""
-    <a href='?selected={encoded_book_id}' target="_self" style="text-decoration: none; display: block;">
-        <div class="book-card-container book-card-{unique_id}" style="
+# Card markup shared by render() and render_to_html(). Positional fields:
+# {0} encoded book id, {1} unique id, {2} cover url, {3} title,
+# {4} display title, {5} display author
+_CARD_FMT = """
+    <a href='?selected={0}' target="_self" style="text-decoration: none; display: block;">
+        <div class="book-card-container book-card-{1}" style="
             width: 100%;
             height: 320px;
             border-radius: 16px;
@@ -51,8 +25,8 @@ def render(book: dict, unique_id: str):
             cursor: pointer;
         ">
             <div style="position: relative; width: 100%; height: 100%; padding: 0; margin: 0;">
-                <img src="{cover_url}"
-                     alt="{title}"
+                <img src="{2}"
+                     alt="{3}"
                      style="
                          width: 100%;
                          height: 100%;
@@ -75,17 +49,61 @@ def render(book: dict, unique_id: str):
                 ">
                     <div style="font-size: 0.875rem; font-weight: 600; margin-bottom: 4px;
                                 overflow: hidden; text-overflow: ellipsis; white-space: nowrap;">
-                        {display_title}
+                        {4}
                     </div>
                     <div style="font-size: 0.75rem; color: #d1d5db;
                                 overflow: hidden; text-overflow: ellipsis; white-space: nowrap;">
-                        {display_author}
+                        {5}
                     </div>
                 </div>
             </div>
         </div>
     </a>
+"""
+
+def _truncate(text: str, limit: int) -> str:
+    """Truncate long titles and authors for the card overlay"""
+    return text[:limit] + '...' if len(text) > limit else text
+
+
+def escape_html(value) -> str:
+    """Escape a book field or chat text for interpolation into HTML"""
+    return str(value).translate(_HTML_TRANS)
+
+
+def _format_card(book_id: str, unique_id: str, cover_url: str, title: str, author: str) -> str:
+    """Fill _CARD_FMT, escaping book fields so one odd title cannot break the markup"""
+    return _CARD_FMT.format(
+        quote(book_id, safe=''), unique_id, escape_html(cover_url),
+        escape_html(title), escape_html(_truncate(title, 35)), escape_html(_truncate(author, 25))
+    )
+
 
+def render(book: dict, unique_id: str):
+    """
+    Render a modern book card as a clickable HTML container
+
+    Args:
+        book: dict with 'title', 'author', 'cover_url'
+        unique_id: unique identifier for the card
+    """
+    cover_url = book.get("cover_url", "")
+    title = book.get("title", "Unknown Title")
+    author = book.get("author", "Unknown Author")
+
+    if not cover_url:
+        return
+
+    # Create a unique book identifier
+    book_id = book.get("id") or f"{title}_{author}"
+
+    # Store book in session state with the ID as key (persistent storage)
+    if "all_books" not in st.session_state:
+        st.session_state.all_books = {}
+    st.session_state.all_books[book_id] = book
+
+    # Create clickable card using HTML anchor tag (like friend's movie app)
+    card_html = _format_card(book_id, unique_id, cover_url, title, author) + f"""
     <style>
         /* Hover effects when hovering over the anchor tag */
         a:has(.book-card-{unique_id}):hover .book-card-{unique_id} {{
@@ -101,3 +119,30 @@ def render(book: dict, unique_id: str):
     """
 
     st.markdown(card_html, unsafe_allow_html=True)
+
+
+def render_to_html(books: list, prefix: str) -> str:
+    """
+    Build the HTML for a grid of book cards in a single string
+
+    Hover effects come from the .book-grid rules in the global stylesheet,
+    so the result can be emitted with one st.markdown call. Missing fields
+    fall back to the same defaults as render().
+
+    Args:
+        books: list of book dicts
+        prefix: prefix for the per-card unique identifiers
+
+    Returns:
+        Concatenated card HTML (books without a cover are skipped)
+    """
+    cards = []
+    for idx, book in enumerate(books):
+        cover_url = book.get("cover_url", "")
+        if not cover_url:
+            continue
+        title = book.get("title", "Unknown Title")
+        author = book.get("author", "Unknown Author")
+        book_id = book.get("id") or f"{title}_{author}"
+        cards.append(_format_card(book_id, f"{prefix}_{idx}", cover_url, title, author))
+    return "".join(cards)
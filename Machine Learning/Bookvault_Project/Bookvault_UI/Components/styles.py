@@ -185,6 +185,19 @@ def get_global_styles() -> str:
         padding: 0 16px 24px 16px;
         max-width: 1600px;
         margin: 0 auto;
+        /* layout only: paint containment would clip the card hover lift and shadow */
+        contain: layout;
+    }
+
+    /* Card hover for grids rendered in one pass (modern_book_card.render_to_html) */
+    .book-grid a:hover .book-card-container {
+        transform: translateY(-8px) scale(1.02) !important;
+        box-shadow: 0 20px 40px rgba(6, 182, 212, 0.6) !important;
+        border-color: #06b6d4 !important;
+    }
+
+    .book-grid a:hover .book-overlay {
+        opacity: 1 !important;
     }
 
     @media (max-width: 1400px) {
@@ -295,6 +308,47 @@ def get_global_styles() -> str:
         margin-top: 16px;
     }
 
+    /* Book Cover - Detail Page */
+    .book-cover-img {
+        max-width: 280px;
+        width: 100%;
+        height: auto;
+        border-radius: 12px;
+        box-shadow: 0 16px 48px rgba(6, 182, 212, 0.5), 0 0 0 1px rgba(6, 182, 212, 0.3);
+        transition: transform 0.3s ease;
+        will-change: transform;
+    }
+
+    .book-cover-img:hover {
+        transform: translateY(-8px) scale(1.02);
+    }
+
+    /* Metadata Cards - Detail Page */
+    .metadata-card {
+        background: rgba(6, 182, 212, 0.12);
+        padding: 12px 18px;
+        border-radius: 12px;
+        border: 1px solid rgba(6, 182, 212, 0.3);
+        transition: all 0.3s ease;
+    }
+
+    .metadata-card:hover {
+        background: rgba(6, 182, 212, 0.2);
+        border-color: rgba(6, 182, 212, 0.5);
+    }
+
+    .metadata-card .label {
+        color: #22d3ee;
+        font-weight: 700;
+        font-size: 1.05rem;
+    }
+
+    .metadata-card .value {
+        color: #e8eaed;
+        font-size: 1rem;
+        font-weight: 500;
+    }
+
     /* Back Button - Cyan Theme */
     .back-button {
         background: rgba(15, 23, 42, 0.8);
@@ -1,14 +1,128 @@
 """
 Book detail page with metadata, quotes, recommendations, and AI chatbot
 """
+import asyncio
+import threading
+import time
+from collections import OrderedDict
 import streamlit as st
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from Bookvault.service import BookVaultService
+from Bookvault.constants import SearchConstants
+from Bookvault.logger import get_logger
+from ..Components import modern_book_card
+from ..Components.modern_book_card import escape_html
+
+logger = get_logger(__name__)
+
+# Chat completion settings for the book assistant
+_CHAT_PARAMS = {"model": "gpt-4o-mini", "max_tokens": 200, "temperature": 0.7}
+
+# Description budget for chat prompts, in words (~200 tokens of English)
+_PROMPT_DESC_WORDS = 150
+
+# Chat messages rendered on each rerun; older ones sit in a collapsed expander
+_RECENT_MESSAGES = 10
+
+# Streamed chunks to accumulate before repainting the answer placeholder
+_STREAM_FLUSH_CHUNKS = 40
+
+# Prefetched quick-start answers keyed by (book key, question), least recently used first.
+# They depend only on the book, so sessions share them; the size cap bounds process memory.
+_ANSWER_CACHE_MAX = 300
+_answer_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+_prefetching: set = set()
+_prefetch_lock = threading.Lock()
+
+# Questions whose prefetch failed (rate limit, timeout, empty reply) are not re-sent for this long
+_PREFETCH_RETRY_SECONDS = 300
+_prefetch_failed: Dict[Tuple[str, str], float] = {}
+
+
+def _get_cached_answer(key: Tuple[str, str]):
+    """Look up a prefetched answer, marking it recently used"""
+    with _prefetch_lock:
+        answer = _answer_cache.get(key)
+        if answer is not None:
+            _answer_cache.move_to_end(key)
+        return answer
+
+
+def _cache_answer(key: Tuple[str, str], answer: str) -> None:
+    """Store a prefetched answer, evicting the least recently used past the cap"""
+    with _prefetch_lock:
+        _answer_cache[key] = answer
+        _answer_cache.move_to_end(key)
+        while len(_answer_cache) > _ANSWER_CACHE_MAX:
+            _answer_cache.popitem(last=False)
+
+
+async def _answer_concurrently(api_key: str, prompts: List[str]) -> List:
+    """Send all prompts to OpenAI concurrently so they share one round-trip of latency"""
+    from openai import AsyncOpenAI
+
+    async with AsyncOpenAI(api_key=api_key) as client:
+        return await asyncio.gather(
+            *(client.chat.completions.create(messages=[{"role": "user", "content": prompt}], **_CHAT_PARAMS)
+              for prompt in prompts),
+            return_exceptions=True
+        )
+
+
+def _prefetch_failed_recently(key: Tuple[str, str], now: float) -> bool:
+    """Whether a prefetch for key failed within the retry cooldown (caller holds _prefetch_lock)"""
+    failed_at = _prefetch_failed.get(key)
+    return failed_at is not None and now - failed_at < _PREFETCH_RETRY_SECONDS
+
+
+def _mark_prefetch_failed(keys: List[Tuple[str, str]]) -> None:
+    """Start the retry cooldown for keys, forgetting failures that have already expired"""
+    now = time.monotonic()
+    with _prefetch_lock:
+        for key in [k for k, t in _prefetch_failed.items() if now - t >= _PREFETCH_RETRY_SECONDS]:
+            del _prefetch_failed[key]
+        _prefetch_failed.update(dict.fromkeys(keys, now))
+
+
+def _prefetch_answers(api_key: str, book_key: str, questions: List[str], prompts: List[str]) -> None:
+    """Background worker: answer questions concurrently and fill the answer cache"""
+    failed = []
+    try:
+        responses = asyncio.run(_answer_concurrently(api_key, prompts))
+        for question, response in zip(questions, responses):
+            if isinstance(response, Exception):
+                logger.warning(f"Prefetch failed for '{question}': {str(response)}")
+                failed.append((book_key, question))
+                continue
+            content = response.choices[0].message.content
+            if not content or not content.strip():
+                logger.warning(f"Prefetch returned no answer for '{question}'")
+                failed.append((book_key, question))
+                continue
+            _cache_answer((book_key, question), content.strip())
+    except Exception as e:
+        logger.error(f"Quick question prefetch failed: {str(e)}")
+        failed = [(book_key, q) for q in questions]
+    finally:
+        if failed:
+            _mark_prefetch_failed(failed)
+        with _prefetch_lock:
+            _prefetching.discard(book_key)
 
 
 class DetailPage:
     """Book detail page with comprehensive information"""
 
+    # Quick start questions offered in the chat dialog: (emoji, label, question)
+    _QUICK_QUESTIONS = [
+        ("📖", "What's the plot?", "What is the plot of this book?"),
+        ("👥", "Main characters?", "Who are the main characters in this book?"),
+        ("🎯", "Main themes?", "What are the main themes of this book?"),
+        ("📊", "Reading level?", "What is the reading level of this book?"),
+        ("⭐", "Why read this?", "Why should I read this book?"),
+        ("📚", "Similar books?", "What books are similar to this one?"),
+    ]
+
     def __init__(self, service: BookVaultService, book: Dict):
         self.service = service
         self.book = book
@@ -243,8 +357,7 @@ class DetailPage:
             from ..App_Pro import cached_search_books
 
             # Check if it's a natural language query
-            nl_keywords = ['about', 'books', 'novel', 'read', 'want', 'looking for', 'recommend', 'like', 'similar to']
-            is_nl_query = any(keyword in query.lower() for keyword in nl_keywords)
+            is_nl_query = bool(SearchConstants.NL_QUERY_PATTERN.search(query))
 
             if is_nl_query:
                 # Use AI to extract search terms and get recommendations
@@ -271,26 +384,25 @@ class DetailPage:
 
     def _get_ai_book_recommendations(self, user_query: str) -> List[Dict]:
         """Use AI to understand natural language and recommend books"""
-        from Bookvault.utils.ai_helpers import get_ai_book_recommendations
-        from ..App_Pro import cached_search_books
-
-        return get_ai_book_recommendations(
-            user_query=user_query,
-            search_function=cached_search_books,
-            max_results=24,
-            cache_key=st.session_state.cache_key
-        )
+        from ..App_Pro import cached_ai_book_recommendations
+
+        return cached_ai_book_recommendations(user_query, st.session_state.cache_key)
 
     def _render_header(self):
         """Render book details header"""
         # Add some top spacing
         st.markdown('<div style="margin-top: 20px;"></div>', unsafe_allow_html=True)
 
+        # Escape API-supplied text once before it is interpolated into HTML
+        title = escape_html(self.book.get("title", "Unknown Title"))
+        author = escape_html(self.book.get("author", "Unknown Author"))
+        description = escape_html(self.book.get("description", "No description available"))
+
         col1, col2 = st.columns([1, 2.5])
 
         with col1:
             # Book cover - centered with max width
-            cover_url = self.book.get("cover_url", "")
+            cover_url = escape_html(self.book.get("cover_url", ""))
             if cover_url:
                 st.markdown(f"""
                 <div style="
@@ -298,24 +410,12 @@ class DetailPage:
                     justify-content: center;
                     align-items: flex-start;
                 ">
-                    <img src="{cover_url}"
-                         alt="{self.book.get('title', '')}"
-                         style="
-                            max-width: 280px;
-                            width: 100%;
-                            height: auto;
-                            border-radius: 12px;
-                            box-shadow: 0 16px 48px rgba(6, 182, 212, 0.5), 0 0 0 1px rgba(6, 182, 212, 0.3);
-                            transition: transform 0.3s ease;
-                         "
-                         onmouseover="this.style.transform='translateY(-8px) scale(1.02)'"
-                         onmouseout="this.style.transform='translateY(0) scale(1)'">
+                    <img class="book-cover-img" src="{cover_url}" alt="{title}">
                 </div>
                 """, unsafe_allow_html=True)
 
         with col2:
             # Title
-            title = self.book.get("title", "Unknown Title")
             st.markdown(f"""
             <h1 style="
                 color: #22d3ee;
@@ -329,7 +429,6 @@ class DetailPage:
             """, unsafe_allow_html=True)
 
             # Author
-            author = self.book.get("author", "Unknown Author")
             st.markdown(f"""
             <p style="
                 font-size: 1.5rem;
@@ -363,7 +462,6 @@ class DetailPage:
             self._render_metadata()
 
             # Description
-            description = self.book.get("description", "No description available")
             st.markdown(f"""
             <div style="
                 margin-top: 28px;
@@ -396,64 +494,24 @@ class DetailPage:
         metadata_items = []
 
         # Published date
-        published = self.book.get("published_date", "")
+        published = escape_html(self.book.get("published_date", ""))
         if published:
-            metadata_items.append(f'''<div style="
-                background: rgba(6, 182, 212, 0.12);
-                padding: 12px 18px;
-                border-radius: 12px;
-                border: 1px solid rgba(6, 182, 212, 0.3);
-                transition: all 0.3s ease;
-            " onmouseover="this.style.background='rgba(6, 182, 212, 0.2)'; this.style.borderColor='rgba(6, 182, 212, 0.5)'"
-               onmouseout="this.style.background='rgba(6, 182, 212, 0.12)'; this.style.borderColor='rgba(6, 182, 212, 0.3)'">
-                <span style="color: #22d3ee; font-weight: 700; font-size: 1.05rem;">📅 Release:</span><br>
-                <span style="color: #e8eaed; font-size: 1rem; font-weight: 500;">{published}</span>
-            </div>''')
+            metadata_items.append(self._metadata_card("📅 Release:", published))
 
         # Page count
         pages = self.book.get("page_count", 0)
         if pages:
-            metadata_items.append(f'''<div style="
-                background: rgba(6, 182, 212, 0.12);
-                padding: 12px 18px;
-                border-radius: 12px;
-                border: 1px solid rgba(6, 182, 212, 0.3);
-                transition: all 0.3s ease;
-            " onmouseover="this.style.background='rgba(6, 182, 212, 0.2)'; this.style.borderColor='rgba(6, 182, 212, 0.5)'"
-               onmouseout="this.style.background='rgba(6, 182, 212, 0.12)'; this.style.borderColor='rgba(6, 182, 212, 0.3)'">
-                <span style="color: #22d3ee; font-weight: 700; font-size: 1.05rem;">📄 Pages:</span><br>
-                <span style="color: #e8eaed; font-size: 1rem; font-weight: 500;">{pages}</span>
-            </div>''')
+            metadata_items.append(self._metadata_card("📄 Pages:", pages))
 
         # Publisher
-        publisher = self.book.get("publisher", "")
+        publisher = escape_html(self.book.get("publisher", ""))
         if publisher:
-            metadata_items.append(f'''<div style="
-                background: rgba(6, 182, 212, 0.12);
-                padding: 12px 18px;
-                border-radius: 12px;
-                border: 1px solid rgba(6, 182, 212, 0.3);
-                transition: all 0.3s ease;
-            " onmouseover="this.style.background='rgba(6, 182, 212, 0.2)'; this.style.borderColor='rgba(6, 182, 212, 0.5)'"
-               onmouseout="this.style.background='rgba(6, 182, 212, 0.12)'; this.style.borderColor='rgba(6, 182, 212, 0.3)'">
-                <span style="color: #22d3ee; font-weight: 700; font-size: 1.05rem;">🏢 Publisher:</span><br>
-                <span style="color: #e8eaed; font-size: 1rem; font-weight: 500;">{publisher}</span>
-            </div>''')
+            metadata_items.append(self._metadata_card("🏢 Publisher:", publisher))
 
         # Language
-        language = self.book.get("language", "")
+        language = escape_html(self.book.get("language", ""))
         if language:
-            metadata_items.append(f'''<div style="
-                background: rgba(6, 182, 212, 0.12);
-                padding: 12px 18px;
-                border-radius: 12px;
-                border: 1px solid rgba(6, 182, 212, 0.3);
-                transition: all 0.3s ease;
-            " onmouseover="this.style.background='rgba(6, 182, 212, 0.2)'; this.style.borderColor='rgba(6, 182, 212, 0.5)'"
-               onmouseout="this.style.background='rgba(6, 182, 212, 0.12)'; this.style.borderColor='rgba(6, 182, 212, 0.3)'">
-                <span style="color: #22d3ee; font-weight: 700; font-size: 1.05rem;">🌐 Language:</span><br>
-                <span style="color: #e8eaed; font-size: 1rem; font-weight: 500;">{language.upper()}</span>
-            </div>''')
+            metadata_items.append(self._metadata_card("🌐 Language:", language.upper()))
 
         if metadata_items:
             metadata_html = f"""
@@ -468,6 +526,14 @@ class DetailPage:
             """
             st.markdown(metadata_html, unsafe_allow_html=True)
 
+    @staticmethod
+    def _metadata_card(label: str, value) -> str:
+        """Build a metadata card (styled by .metadata-card in the global stylesheet)"""
+        return (
+            f'<div class="metadata-card"><span class="label">{label}</span><br>'
+            f'<span class="value">{value}</span></div>'
+        )
+
     def _render_quotes(self):
         """Render thematic quotes inspired by the book"""
         st.markdown("""
@@ -489,12 +555,18 @@ class DetailPage:
         </div>
         """, unsafe_allow_html=True)
 
+        title = self.book.get("title", "")
+        author = self.book.get("author", "")
+        if not (title or author):
+            st.info("📚 No quotes available for this book.")
+            return
+
         try:
             with st.spinner("📚 Fetching quotes..."):
                 # Get quotes from AI
                 quotes = self.service.ai_engine.get_famous_quotes(
-                    title=self.book.get("title", ""),
-                    author=self.book.get("author", ""),
+                    title=title,
+                    author=author,
                     description=self.book.get("description", ""),
                     num_quotes=3
                 )
@@ -545,26 +617,35 @@ class DetailPage:
         </div>
         """, unsafe_allow_html=True)
 
+        title = self.book.get("title", "")
+        author = self.book.get("author", "")
+        description = self.book.get("description", "")
+
+        # Nothing to base recommendations on - skip the AI call entirely
+        if not any((title, author, description)):
+            st.info("No recommendations available.")
+            return
+
         try:
             from ..App_Pro import cached_ai_recommendations
-            from ..Components import modern_book_card
 
             categories = self.book.get("categories", [])
             categories_str = ", ".join(categories) if isinstance(categories, list) else str(categories)
 
             with st.spinner("🤖 Finding perfect recommendations for you..."):
                 recommendations = cached_ai_recommendations(
-                    title=self.book.get("title", ""),
-                    author=self.book.get("author", ""),
-                    description=self.book.get("description", ""),
+                    title=title,
+                    author=author,
+                    description=description,
                     categories=categories_str,
                     max_results=24
                 )
 
                 # Filter out current book
+                title_lower = title.lower()
                 recommendations = [
                     r for r in recommendations
-                    if r.get("title", "").lower() != self.book.get("title", "").lower()
+                    if r.get("title", "").lower() != title_lower
                 ]
 
                 if recommendations:
@@ -576,13 +657,9 @@ class DetailPage:
                         if book_id:
                             st.session_state.all_books[book_id] = rec_book
 
-                    # Display in grid
-                    st.markdown('<div class="book-grid">', unsafe_allow_html=True)
-                    cols = st.columns(6)
-                    for idx, rec_book in enumerate(recommendations[:18]):
-                        with cols[idx % 6]:
-                            modern_book_card.render(rec_book, f"rec_{idx}")
-                    st.markdown('</div>', unsafe_allow_html=True)
+                    # Display in grid (single markdown element for all cards)
+                    grid_html = modern_book_card.render_to_html(recommendations[:18], "rec")
+                    st.markdown(f'<div class="book-grid">{grid_html}</div>', unsafe_allow_html=True)
                 else:
                     st.info("No recommendations available at this time.")
 
@@ -672,6 +749,10 @@ class DetailPage:
             box-shadow:
                 inset 0 2px 12px rgba(0, 0, 0, 0.4),
                 0 0 0 1px rgba(6, 182, 212, 0.1) inset;
+            /* Keep message reflows/repaints local to the chat area */
+            contain: layout paint;
+            content-visibility: auto;
+            contain-intrinsic-size: 280px;
         }
 
         /* User message bubbles - modern blue gradient */
@@ -732,6 +813,14 @@ class DetailPage:
             }
         }
 
+        /* Promote message bubbles to compositor layers only on hover-capable devices */
+        @media (hover: hover) {
+            .chat-user-message:hover,
+            .chat-ai-message:hover {
+                will-change: transform;
+            }
+        }
+
         /* Enhanced close button */
         .close-chat-btn button {
             background: linear-gradient(135deg, #dc2626 0%, #991b1b 100%) !important;
@@ -973,24 +1062,9 @@ class DetailPage:
         st.markdown('<p class="chat-section-title" style="margin-top: 20px;">💬 Conversation</p>', unsafe_allow_html=True)
 
         if st.session_state.chat_messages:
-            messages_html = '<div class="chat-messages-area" style="max-height: 280px; overflow-y: auto; padding: 20px;">'
-            for msg in st.session_state.chat_messages:
-                if msg["role"] == "user":
-                    messages_html += f"""
-                    <div class="chat-user-message">
-                        <strong style="color: #bfdbfe; font-size: 0.95rem; letter-spacing: 0.3px;">👤 You</strong>
-                        <p style="color: #eff6ff; margin: 10px 0 0 0; line-height: 1.7; font-size: 0.95rem;">{msg['content']}</p>
-                    </div>
-                    """
-                else:
-                    messages_html += f"""
-                    <div class="chat-ai-message">
-                        <strong style="color: #a7f3d0; font-size: 0.95rem; letter-spacing: 0.3px;">🤖 AI Assistant</strong>
-                        <p style="color: #ecfdf5; margin: 10px 0 0 0; line-height: 1.7; font-size: 0.95rem;">{msg['content']}</p>
-                    </div>
-                    """
-            messages_html += '</div>'
-            st.markdown(messages_html, unsafe_allow_html=True)
+            self._render_message_history(
+                '<div class="chat-messages-area" style="max-height: 280px; overflow-y: auto; padding: 20px;">{}</div>'
+            )
         else:
             st.markdown("""
             <div class="chat-messages-area">
@@ -1002,6 +1076,39 @@ class DetailPage:
             </div>
             """, unsafe_allow_html=True)
 
+    @staticmethod
+    def _messages_html(messages: List[Dict]) -> str:
+        """Build the HTML for a run of chat messages"""
+        parts = []
+        for msg in messages:
+            content = escape_html(msg["content"])
+            if msg["role"] == "user":
+                parts.append(f"""
+                    <div class="chat-user-message">
+                        <strong style="color: #bfdbfe; font-size: 0.95rem; letter-spacing: 0.3px;">👤 You</strong>
+                        <p style="color: #eff6ff; margin: 10px 0 0 0; line-height: 1.7; font-size: 0.95rem;">{content}</p>
+                    </div>
+                    """)
+            else:
+                parts.append(f"""
+                    <div class="chat-ai-message">
+                        <strong style="color: #a7f3d0; font-size: 0.95rem; letter-spacing: 0.3px;">🤖 AI Assistant</strong>
+                        <p style="color: #ecfdf5; margin: 10px 0 0 0; line-height: 1.7; font-size: 0.95rem;">{content}</p>
+                    </div>
+                    """)
+        return "".join(parts)
+
+    def _render_message_history(self, wrapper: str = "{}") -> None:
+        """Render the last few chat messages in one markdown call, older ones in an expander"""
+        messages = st.session_state.chat_messages
+        older, recent = messages[:-_RECENT_MESSAGES], messages[-_RECENT_MESSAGES:]
+
+        if older:
+            with st.expander(f"{len(older)} earlier messages"):
+                st.markdown(wrapper.format(self._messages_html(older)), unsafe_allow_html=True)
+
+        st.markdown(wrapper.format(self._messages_html(recent)), unsafe_allow_html=True)
+
     def _render_chat_input_form(self) -> None:
         """Render chat input form with send and clear buttons"""
         st.markdown('<p class="chat-section-title" style="margin-top: 20px;">✏️ Ask a Question</p>', unsafe_allow_html=True)
@@ -1024,9 +1131,8 @@ class DetailPage:
             # Handle form submission
             if submitted and user_input and user_input.strip():
                 st.session_state.chat_messages.append({"role": "user", "content": user_input})
-                with st.spinner("🤖 Thinking..."):
-                    ai_response = self._get_ai_response(user_input)
-                    st.session_state.chat_messages.append({"role": "assistant", "content": ai_response})
+                ai_response = self._get_ai_response(user_input, st.empty())
+                st.session_state.chat_messages.append({"role": "assistant", "content": ai_response})
                 st.rerun()
 
             # Handle clear button
@@ -1036,6 +1142,9 @@ class DetailPage:
 
     def _render_chat_sidebar(self):
         """Render AI chat UI in the right sidebar column"""
+        # Answer all quick start questions in the background while the user reads
+        self._prefetch_quick_answers()
+
         # Apply chat styles
         st.markdown(self._get_chat_styles(), unsafe_allow_html=True)
 
@@ -1044,6 +1153,7 @@ class DetailPage:
 
         # Render chat components
         self._render_chat_header()
+
         self._render_chat_messages()
         self._render_chat_input_form()
 
@@ -1056,39 +1166,14 @@ class DetailPage:
         st.markdown("### 💡 Quick Start Questions")
         st.caption("Click a question below or ask your own")
 
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            if st.button("📖 What's the plot?", use_container_width=True, key="q1"):
-                st.session_state.quick_question = "What is the plot of this book?"
-                st.rerun()
-
-        with col2:
-            if st.button("👥 Main characters?", use_container_width=True, key="q2"):
-                st.session_state.quick_question = "Who are the main characters in this book?"
-                st.rerun()
-
-        with col3:
-            if st.button("🎯 Main themes?", use_container_width=True, key="q3"):
-                st.session_state.quick_question = "What are the main themes of this book?"
-                st.rerun()
-
-        col4, col5, col6 = st.columns(3)
-
-        with col4:
-            if st.button("📊 Reading level?", use_container_width=True, key="q4"):
-                st.session_state.quick_question = "What is the reading level of this book?"
-                st.rerun()
-
-        with col5:
-            if st.button("⭐ Why read this?", use_container_width=True, key="q5"):
-                st.session_state.quick_question = "Why should I read this book?"
-                st.rerun()
-
-        with col6:
-            if st.button("📚 Similar books?", use_container_width=True, key="q6"):
-                st.session_state.quick_question = "What books are similar to this one?"
-                st.rerun()
+        # Callbacks fill the input before the dialog reruns; nothing reloads the page
+        cols = st.columns(3) + st.columns(3)
+        for idx, (emoji, label, question) in enumerate(self._QUICK_QUESTIONS):
+            with cols[idx]:
+                st.button(
+                    f"{emoji} {label}", use_container_width=True, key=f"q{idx + 1}",
+                    on_click=self._pick_quick_question, args=(question,)
+                )
 
         st.divider()
 
@@ -1098,11 +1183,7 @@ class DetailPage:
 
         with chat_container:
             if st.session_state.chat_messages:
-                for idx, msg in enumerate(st.session_state.chat_messages):
-                    if msg["role"] == "user":
-                        st.info(f"**👤 You:** {msg['content']}")
-                    else:
-                        st.success(f"**🤖 AI:** {msg['content']}")
+                self._render_message_history()
             else:
                 st.caption("No messages yet. Ask a question to start chatting!")
 
@@ -1111,15 +1192,10 @@ class DetailPage:
         # Input section
         user_input = st.text_input(
             "Ask anything about this book...",
-            value=st.session_state.quick_question,
             key="dialog_chat_input",
             placeholder="e.g., What makes this book unique? Who would enjoy it?"
         )
 
-        # Clear quick question after displaying
-        if st.session_state.quick_question:
-            st.session_state.quick_question = ""
-
         col1, col2 = st.columns([3, 1])
 
         with col1:
@@ -1131,13 +1207,13 @@ class DetailPage:
                         "content": user_input
                     })
 
-                    # Generate AI response
-                    with st.spinner("🤖 AI is thinking..."):
-                        ai_response = self._get_ai_response(user_input)
-                        st.session_state.chat_messages.append({
-                            "role": "assistant",
-                            "content": ai_response
-                        })
+                    # Generate AI response, streaming it into the chat history
+                    with chat_container:
+                        ai_response = self._get_ai_response(user_input, st.empty())
+                    st.session_state.chat_messages.append({
+                        "role": "assistant",
+                        "content": ai_response
+                    })
 
                     st.rerun()
                 else:
@@ -1148,39 +1224,90 @@ class DetailPage:
                 st.session_state.chat_messages = []
                 st.rerun()
 
-    def _get_ai_response(self, user_question: str) -> str:
-        """Get AI response for user question about the book"""
-        try:
-            from openai import OpenAI
-            from ..App_Pro import get_service
+    @staticmethod
+    def _pick_quick_question(question: str) -> None:
+        """Quick question callback: prefill the dialog's input"""
+        st.session_state.dialog_chat_input = question
 
-            service = get_service()
-            client = OpenAI(api_key=service.ai_engine.client.api_key)
+    def _book_key(self) -> str:
+        """Identifier for the current book (same scheme as all_books keys)"""
+        return self.book.get("id") or f"{self.book.get('title', '')}_{self.book.get('author', '')}"
 
-            title = self.book.get("title", "")
-            author = self.book.get("author", "")
-            description = self.book.get("description", "")
-            categories = self.book.get("categories", [])
+    def _build_chat_prompt(self, user_question: str) -> str:
+        """Build the book-context prompt for a user question"""
+        title = self.book.get("title", "")
+        author = self.book.get("author", "")
+        categories = self.book.get("categories", [])
+
+        # Truncate once per book; the selected book dict lives in session state across reruns
+        description = self.book.get("_desc_truncated")
+        if description is None:
+            words = (self.book.get("description") or "").split()
+            description = self.book["_desc_truncated"] = " ".join(words[:_PROMPT_DESC_WORDS])
 
-            context = f"""
+        return f"""
 Book Title: {title}
 Author: {author}
 Categories: {', '.join(categories) if isinstance(categories, list) else categories}
-Description: {description[:500]}
+Description: {description}
 
 User Question: {user_question}
 
 Provide a helpful, concise answer about this book. Be friendly and informative.
 """
 
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": context}],
-                max_tokens=200,
-                temperature=0.7
-            )
+    def _prefetch_quick_answers(self) -> None:
+        """Answer every quick start question concurrently in a background thread"""
+        book_key = self._book_key()
+        now = time.monotonic()
+        with _prefetch_lock:
+            questions = [
+                q for _, _, q in self._QUICK_QUESTIONS
+                if (book_key, q) not in _answer_cache and not _prefetch_failed_recently((book_key, q), now)
+            ]
+            if not questions or book_key in _prefetching:
+                return
+            _prefetching.add(book_key)
+
+        prompts = [self._build_chat_prompt(q) for q in questions]
+        api_key = self.service.ai_engine.client.api_key
+        threading.Thread(
+            target=_prefetch_answers,
+            args=(api_key, book_key, questions, prompts),
+            daemon=True
+        ).start()
+
+    def _get_ai_response(self, user_question: str, placeholder=None) -> str:
+        """Get AI response for user question about the book, streaming it into placeholder if given"""
+        cached = _get_cached_answer((self._book_key(), user_question))
+        if cached:
+            return cached
+
+        try:
+            from ..App_Pro import get_service
+
+            # Reuse the engine's long-lived client rather than building one per question
+            client = get_service().ai_engine.client
+            messages = [{"role": "user", "content": self._build_chat_prompt(user_question)}]
+
+            if placeholder is None:
+                response = client.chat.completions.create(messages=messages, **_CHAT_PARAMS)
+                return response.choices[0].message.content.strip()
+
+            placeholder.caption("🤖 Thinking...")
+            stream = client.chat.completions.create(messages=messages, stream=True, **_CHAT_PARAMS)
+
+            # Repaint every few dozen chunks instead of per token
+            parts = []
+            for idx, chunk in enumerate(stream, 1):
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+                if idx % _STREAM_FLUSH_CHUNKS == 0:
+                    placeholder.markdown(f"**🤖 AI:** {''.join(parts)}▌")
 
-            return response.choices[0].message.content.strip()
+            answer = "".join(parts).strip()
+            placeholder.markdown(f"**🤖 AI:** {answer}")
+            return answer
 
         except Exception as e:
             return f"I apologize, but I encountered an error: {str(e)}. Please try asking your question again."
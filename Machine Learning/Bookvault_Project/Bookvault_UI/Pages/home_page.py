@@ -2,18 +2,154 @@
 Home page with hero section and genre-based browsing
 """
 import streamlit as st
+import itertools
 import random
-from typing import List, Dict, Optional, Tuple
+import threading
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Set, Tuple
 from Bookvault.service import BookVaultService
+from Bookvault.apis.openai_engine import BatchFailedError
+from Bookvault.constants import SearchConstants
 from Bookvault.logger import get_logger
 from Bookvault.config import Config
+from ..Components import modern_book_card
 
 logger = get_logger(__name__)
 
 
+def _book_key(book: Dict) -> str:
+    """Identity of a book for dedup and all_books: its id, else "title_author"; cached on the dict"""
+    key = book.get("_key")
+    if key is None:
+        key = book["_key"] = book.get("id") or f"{book.get('title', '')}_{book.get('author', '')}"
+    return key
+
+
+@dataclass
+class GenreCache:
+    """Cached books for one genre, with the dedup keys of every book merged so far"""
+    books: List[Dict] = field(default_factory=list)
+    keys: Set = field(default_factory=set)
+    # Number of leading books already filtered by genre verification
+    verified: int = 0
+
+    def extend(self, new_books: List[Dict]) -> int:
+        """Append books not seen before; returns how many were added"""
+        added = 0
+        for book in new_books:
+            key = _book_key(book)
+            if key not in self.keys:
+                self.keys.add(key)
+                self.books.append(book)
+                added += 1
+        return added
+
+
+@dataclass
+class GenreBatch:
+    """One Batch API genre check, shared by every session; books are the ones the prompt listed"""
+    books: List[Dict]
+    batch_id: Optional[str] = None
+    rejected: Optional[Set[str]] = None
+
+
+@st.cache_resource
+def _genre_batches() -> Tuple[Dict[str, GenreBatch], threading.Lock]:
+    """Genre verification batches by genre; process-wide so results outlive the session that queued them"""
+    return {}, threading.Lock()
+
+
+def _submit_genre_batch(ai_engine, genre: str, entry: GenreBatch,
+                        batches: Dict[str, GenreBatch], lock: threading.Lock) -> None:
+    """Background worker: submit the batch, forgetting the genre on failure so a later render retries"""
+    batch_id = ai_engine.submit_genre_verification_batch(entry.books, genre)
+    with lock:
+        if batch_id:
+            entry.batch_id = batch_id
+        else:
+            batches.pop(genre, None)
+
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _fetch_genre_catalog(genre: str, target_books: int = 50) -> List[Dict]:
+    """Fetch up to target_books unique books for a genre, shared by all sessions (1 hour TTL)"""
+    from ..App_Pro import parallel_search_books
+
+    rng = random.Random(genre)
+    seen: Dict = {}
+    start_index = rng.randint(0, 10)
+    fetch_count = 0
+    max_total_fetches = 30
+    consecutive_empty = 0
+    pages_per_round = 5
+
+    # Fetch books with pagination, several consecutive pages per round in parallel
+    while len(seen) < target_books and fetch_count < max_total_fetches:
+        queries = [(f"subject:{genre}", start_index + page * 40) for page in range(pages_per_round)]
+        pages = parallel_search_books(queries, max_results=40)
+
+        fetch_count += len(queries)
+        books = [book for page_books in pages for book in page_books]
+
+        if not books:
+            consecutive_empty += 1
+            if consecutive_empty >= 3:
+                start_index = 0
+                consecutive_empty = 0
+            else:
+                start_index = rng.randint(0, 100)
+            continue
+
+        consecutive_empty = 0
+
+        # Keep the first copy of each book (one hash per book)
+        for book in books:
+            seen.setdefault(_book_key(book), book)
+
+        start_index += pages_per_round * 40
+
+    all_valid_books = list(seen.values())[:target_books]
+
+    logger.info(f"Fetched catalog for [{genre}]: {len(all_valid_books)} books in {fetch_count} requests")
+    return all_valid_books
+
+
 class HomePage:
     """Home page with hero banner and genre browsing"""
 
+    _GENRE_EMOJI = {
+        "Fiction": "📚",
+        "Thriller": "⚡",
+        "Mystery": "🔍",
+        "Fantasy": "🐉",
+        "Romance": "💖",
+        "Horror": "🎃",
+        "Biography": "👤",
+        "History": "📜",
+        "Self-Help": "💡",
+        "Poetry": "✍️"
+    }
+
+    # Section header markup per genre, filled on first render
+    _HEADER_CACHE: Dict[str, str] = {}
+
+    # Session state key holding each genre's Load More page count
+    _PAGE_KEY_CACHE: Dict[str, str] = {}
+
+    # Static chrome, each emitted as a single markdown element
+    _HERO_HTML = """
+        <div class="hero-section">
+            <h1 class="hero-title">📚 BOOKVAULT</h1>
+            <h2 class="hero-subtitle">Discover Your Next Literary Adventure</h2>
+            <p class="hero-description">✨ AI-Powered Discovery • 🎯 Smart Recommendations • 🌍 Millions of Titles</p>
+        </div>
+        """
+    _GENRE_BROWSING_HTML = (
+        '<div class="section-header">🎭 EXPLORE BY GENRE</div>'
+        '<p style="color: #9ca3af; padding-left: 24px; margin-bottom: 20px; font-size: 1rem;">'
+        'Choose your favorite genre and start exploring:</p>'
+    )
+
     def __init__(self, service: BookVaultService):
         self.service = service
         # Genre list: First 7 are shown in "All Genres" view (6 genres displayed)
@@ -40,13 +176,7 @@ class HomePage:
 
     def _render_hero(self) -> None:
         """Render hero section"""
-        st.markdown("""
-        <div class="hero-section">
-            <h1 class="hero-title">📚 BOOKVAULT</h1>
-            <h2 class="hero-subtitle">Discover Your Next Literary Adventure</h2>
-            <p class="hero-description">✨ AI-Powered Discovery • 🎯 Smart Recommendations • 🌍 Millions of Titles</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(self._HERO_HTML, unsafe_allow_html=True)
 
     def _render_search(self) -> None:
         """Render AI-powered search bar and image upload"""
@@ -143,15 +273,13 @@ class HomePage:
     def _handle_ai_search(self, query: str) -> None:
         """Handle AI-powered natural language search with typo correction"""
         try:
-            from ..App_Pro import cached_search_books
-            from Bookvault.search_intelligence import SearchIntelligence
+            from ..App_Pro import cached_search_books, get_search_ai
 
-            # Initialize search intelligence
-            search_ai = SearchIntelligence()
+            # Shared search intelligence instance
+            search_ai = get_search_ai()
 
             # Check if it's a natural language query (contains keywords like "about", "books", "want", etc.)
-            nl_keywords = ['about', 'books', 'novel', 'read', 'want', 'looking for', 'recommend', 'like', 'similar to']
-            is_nl_query = any(keyword in query.lower() for keyword in nl_keywords)
+            is_nl_query = bool(SearchConstants.NL_QUERY_PATTERN.search(query))
 
             if is_nl_query:
                 # Use AI to extract search terms and get recommendations
@@ -245,32 +373,30 @@ class HomePage:
 
     def _get_ai_book_recommendations(self, user_query: str) -> List[Dict]:
         """Use AI to understand natural language and recommend books"""
-        from Bookvault.utils.ai_helpers import get_ai_book_recommendations
-        from ..App_Pro import cached_search_books
+        from ..App_Pro import cached_ai_book_recommendations
 
-        return get_ai_book_recommendations(
-            user_query=user_query,
-            search_function=cached_search_books,
-            max_results=24,
-            cache_key=st.session_state.cache_key
-        )
+        return cached_ai_book_recommendations(user_query, st.session_state.cache_key)
 
     def _render_genre_browsing(self) -> None:
         """Render genre browsing section"""
-        st.markdown("""
-        <div class="section-header">
-            🎭 EXPLORE BY GENRE
-        </div>
-        """, unsafe_allow_html=True)
-
-        st.markdown('<p style="color: #9ca3af; padding-left: 24px; margin-bottom: 20px; font-size: 1rem;">Choose your favorite genre and start exploring:</p>', unsafe_allow_html=True)
-
-        selected_genre = st.selectbox(
+        # Header and prompt share one element ahead of the genre pills
+        st.markdown(self._GENRE_BROWSING_HTML, unsafe_allow_html=True)
+
+        # ?genre= deep-links a genre on first load; after that the pills drive the
+        # choice through session state, so picking one never reloads the page
+        selected_genre = st.session_state.get("selected_genre") or st.query_params.get("genre", "All Genres")
+        if selected_genre not in self.genres:
+            selected_genre = "All Genres"
+        st.session_state.selected_genre = selected_genre
+
+        st.session_state.genre_pills = selected_genre
+        st.pills(
             "Genre",
             options=self.genres,
-            index=0,
+            selection_mode="single",
             label_visibility="collapsed",
-            key="genre_selector"
+            key="genre_pills",
+            on_change=self._select_genre
         )
 
         # Show books for selected genre
@@ -279,36 +405,51 @@ class HomePage:
         else:
             self._render_single_genre(selected_genre)
 
+    @staticmethod
+    def _select_genre() -> None:
+        """Pills callback: keep the choice in session and mirror it to ?genre="""
+        # Clicking the active pill deselects it; treat that as keeping the current genre
+        genre = st.session_state.genre_pills or st.session_state.selected_genre
+        st.session_state.selected_genre = genre
+        st.query_params["genre"] = genre
+
     def _render_all_genres(self) -> None:
         """Render books from multiple genres - 12 books initially, with Load More option"""
-        import time
-
         display_genres = [g for g in self.genres if g != "All Genres"][:6]
 
+        # Fetch the first page of every uncached genre concurrently
+        prefetched = self._prefetch_initial_genre_books(display_genres)
+
         for idx, genre in enumerate(display_genres):
             is_last_genre = (idx == len(display_genres) - 1)
-            made_api_call = self._render_genre_section(genre, idx, is_last_genre)
+            self._render_genre_section(genre, idx, is_last_genre, prefetched.get(genre))
+
+    def _prefetch_initial_genre_books(self, genres: List[str]) -> Dict[str, List[Dict]]:
+        """Fetch the initial page for all genres not yet cached in one parallel round-trip"""
+        from ..App_Pro import parallel_search_books
+
+        pending = [g for g in genres if f"all_genres_{g}_books" not in st.session_state]
+        if not pending:
+            return {}
 
-            # Add delay between API calls to avoid rate limiting (but not after last genre)
-            if not is_last_genre and made_api_call:
-                time.sleep(Config.GENRE_API_DELAY_SECONDS)
-                logger.info(f"Added {Config.GENRE_API_DELAY_SECONDS}s delay after loading {genre} to avoid rate limiting")
+        queries = [(f"subject:{g}", self._initial_start_index(g)) for g in pending]
+        results = parallel_search_books(queries, max_results=40)
+        logger.info(f"Fetched initial books for {len(pending)} genres in parallel")
+        return dict(zip(pending, results))
 
-    def _render_genre_section(self, genre: str, idx: int, is_last_genre: bool) -> bool:
+    @st.fragment
+    def _render_genre_section(
+        self, genre: str, idx: int, is_last_genre: bool, prefetched: Optional[List[Dict]] = None
+    ) -> None:
         """
         Render a single genre section in the All Genres view
 
-        Returns:
-            bool: True if an API call was made, False otherwise
-        """
-        from ..App_Pro import cached_search_books
-        from ..Components import modern_book_card
+        Runs as a fragment so Load More reruns only this genre, not the whole page.
 
-        st.markdown(f"""
-        <div class="section-header">
-            {self._get_genre_emoji(genre)} {genre.upper()}
-        </div>
-        """, unsafe_allow_html=True)
+        Args:
+            prefetched: First page of books already fetched for this genre, if any
+        """
+        st.markdown(self._section_header_html(genre), unsafe_allow_html=True)
 
         state_key = f"all_genres_{genre}_count"
         books_cache_key = f"all_genres_{genre}_books"
@@ -318,14 +459,10 @@ class HomePage:
             st.session_state[state_key] = Config.BOOKS_PER_PAGE_INITIAL
 
         books_to_display = st.session_state[state_key]
-        made_api_call = False
 
         try:
             # Get or fetch books for this genre
-            all_books, api_called = self._get_or_fetch_genre_books(
-                genre, books_cache_key, books_to_display
-            )
-            made_api_call = api_called
+            all_books = self._get_or_fetch_genre_books(genre, books_cache_key, books_to_display, prefetched)
 
             # Display the books
             self._display_genre_books(genre, all_books, books_to_display, state_key)
@@ -334,52 +471,91 @@ class HomePage:
             logger.error(f"EXCEPTION [{genre}]: {str(e)}", exc_info=True)
             st.error(f"Could not load {genre} books: {str(e)}")
 
-        return made_api_call
-
     def _get_or_fetch_genre_books(
-        self, genre: str, books_cache_key: str, books_to_display: int
-    ) -> Tuple[List[Dict], bool]:
+        self, genre: str, books_cache_key: str, books_to_display: int,
+        prefetched: Optional[List[Dict]] = None
+    ) -> List[Dict]:
         """
         Get cached books or fetch new ones for a genre
 
         Returns:
-            tuple: (list of books, whether API call was made)
+            list: Books cached for the genre
         """
-        from ..App_Pro import cached_search_books
-
-        made_api_call = False
-
         # Check if we have cached books
         if books_cache_key in st.session_state:
-            all_books = st.session_state[books_cache_key]
-            logger.info(f"Using cached books for [{genre}]: {len(all_books)} books available")
+            cache = st.session_state[books_cache_key]
+            self._merge_genre_verification(genre, cache)
+            logger.info(f"Using cached books for [{genre}]: {len(cache.books)} books available")
 
             # Lazy load more if needed
-            if books_to_display > len(all_books) - 3 and len(all_books) < Config.MAX_BOOKS_PER_GENRE:
-                made_api_call = True
-                all_books = self._fetch_more_books_for_genre(genre, all_books)
-                st.session_state[books_cache_key] = all_books
+            if books_to_display > len(cache.books) - 3 and len(cache.books) < Config.MAX_BOOKS_PER_GENRE:
+                self._fetch_more_books_for_genre(genre, cache)
         else:
             # First time - fetch and cache
-            made_api_call = True
-            all_books = self._fetch_initial_books_for_genre(genre)
-            st.session_state[books_cache_key] = all_books
-
-        return all_books, made_api_call
+            cache = self._fetch_initial_books_for_genre(genre, prefetched)
+            st.session_state[books_cache_key] = cache
+
+            if Config.BATCH_GENRE_VERIFICATION:
+                self._queue_genre_verification(genre, cache.books)
+
+        return cache.books
+
+    def _queue_genre_verification(self, genre: str, books: List[Dict]) -> None:
+        """Queue one shared Batch API genre check per genre, submitted off the render path"""
+        batches, lock = _genre_batches()
+        with lock:
+            if genre in batches or not books:
+                return
+            # The batch prompt covers the first 30 books
+            entry = batches[genre] = GenreBatch(books[:30])
+
+        threading.Thread(
+            target=_submit_genre_batch,
+            args=(self.service.ai_engine, genre, entry, batches, lock),
+            daemon=True
+        ).start()
+
+    def _merge_genre_verification(self, genre: str, cache: GenreCache) -> None:
+        """Drop books a finished genre verification batch rejected from the cached genre books"""
+        from ..App_Pro import cached_batch_answer
+
+        batches, lock = _genre_batches()
+        entry = batches.get(genre)
+        if entry is None or not entry.batch_id:
+            return
 
-    def _fetch_more_books_for_genre(self, genre: str, all_books: List[Dict]) -> List[Dict]:
-        """Fetch additional books for a genre (lazy loading)"""
+        if entry.rejected is None:
+            try:
+                answer = cached_batch_answer(entry.batch_id)
+            except BatchFailedError as e:
+                # Dead batch: forget it and queue a fresh one instead of polling it forever
+                logger.warning(f"Genre verification for [{genre}] failed: {e}")
+                with lock:
+                    if batches.get(genre) is entry:
+                        del batches[genre]
+                self._queue_genre_verification(genre, cache.books)
+                return
+            if answer is None:
+                return
+            verified = self.service.ai_engine.parse_genre_verification(answer, entry.books)
+            # An empty answer would wipe the genre; treat it as no verdict like a parse failure
+            kept = {_book_key(book) for book in (verified or entry.books)}
+            entry.rejected = {_book_key(book) for book in entry.books} - kept
+            logger.info(f"Batch verification for [{genre}]: kept {len(kept)}/{len(entry.books)} books")
+
+        # Rejected books keep their key in cache.keys so lazy loading does not bring them back
+        if cache.verified < len(cache.books):
+            cache.books = [book for book in cache.books if _book_key(book) not in entry.rejected]
+            cache.verified = len(cache.books)
+
+    def _fetch_more_books_for_genre(self, genre: str, cache: GenreCache) -> None:
+        """Fetch additional books for a genre into its cache (lazy loading)"""
         from ..App_Pro import cached_search_books
 
-        logger.info(f"Need more books for [{genre}]. Have {len(all_books)}")
-        existing_ids = {
-            book.get("id") or f"{book.get('title', '')}_{book.get('author', '')}"
-            for book in all_books
-        }
+        logger.info(f"Need more books for [{genre}]. Have {len(cache.books)}")
 
         # Fetch next batch from a new position
-        random.seed(hash(genre + st.session_state.cache_key + str(len(all_books))))
-        next_position = random.randint(len(all_books), 150)
+        next_position = self._genre_rng(genre, len(cache.books)).randint(len(cache.books), 150)
 
         books = cached_search_books(
             f"subject:{genre}",
@@ -392,60 +568,56 @@ class HomePage:
 
         logger.info(f"Fetched {len(books)} more books for [{genre}] at position {next_position}")
 
-        # Add unique books
-        for book in books:
-            book_id = book.get("id") or f"{book.get('title', '')}_{book.get('author', '')}"
-            if book_id and book_id not in existing_ids:
-                all_books.append(book)
-                existing_ids.add(book_id)
+        cache.extend(books)
+        logger.info(f"Updated cache for [{genre}]: now {len(cache.books)} books")
+
+    def _genre_rng(self, genre: str, salt: object = "") -> random.Random:
+        """
+        Session-stable random generator for a genre, independent of the global RNG
+
+        Seeded with a string rather than hash(), which is randomized per process,
+        so a given session key always yields the same book order.
+        """
+        return random.Random(f"{st.session_state.cache_key}:{genre}:{salt}")
 
-        logger.info(f"Updated cache for [{genre}]: now {len(all_books)} books")
-        return all_books
+    def _initial_start_index(self, genre: str) -> int:
+        """Session-stable random start position for a genre's first fetch"""
+        return self._genre_rng(genre).randint(0, 20)
 
-    def _fetch_initial_books_for_genre(self, genre: str) -> List[Dict]:
-        """Fetch initial books for a genre (first time)"""
+    def _fetch_initial_books_for_genre(self, genre: str, books: Optional[List[Dict]] = None) -> GenreCache:
+        """Fetch initial books for a genre (first time), unless already prefetched"""
         from ..App_Pro import cached_search_books
 
-        random.seed(hash(genre + st.session_state.cache_key))
-        random_start = random.randint(0, 20)
-
-        all_books = []
-        existing_ids = set()
-        target_books = 20
+        rng = self._genre_rng(genre)
+        random_start = rng.randint(0, 20)
 
-        books = cached_search_books(
-            f"subject:{genre}",
-            max_results=40,
-            start_index=random_start,
-            cache_key=st.session_state.cache_key,
-            verify_genre=False,
-            expected_genre=genre
-        )
+        if books is None:
+            books = cached_search_books(
+                f"subject:{genre}",
+                max_results=40,
+                start_index=random_start,
+                cache_key=st.session_state.cache_key,
+                verify_genre=False,
+                expected_genre=genre
+            )
 
         logger.info(f"DEBUG [{genre}]: Received {len(books)} books from API at position {random_start}")
         if books:
             logger.info(f"   First book: {books[0].get('title', 'NO TITLE')} (ID: {books[0].get('id', 'NO ID')})")
 
-        # Add unique books
-        for book in books:
-            book_id = book.get("id") or f"{book.get('title', '')}_{book.get('author', '')}"
-            if book_id and book_id not in existing_ids:
-                all_books.append(book)
-                existing_ids.add(book_id)
-
-        logger.info(f"   Total unique books: {len(all_books)}")
+        cache = GenreCache()
+        cache.extend(books)
+        logger.info(f"   Total unique books: {len(cache.books)}")
 
-        # Shuffle once and cache
-        random.shuffle(all_books)
-        logger.info(f"Cached shuffled books for [{genre}]: {len(all_books)} books")
-        return all_books
+        # Seeded order, computed once and cached; load more only extends the slice
+        cache.books = rng.sample(cache.books, len(cache.books))
+        logger.info(f"Cached shuffled books for [{genre}]: {len(cache.books)} books")
+        return cache
 
     def _display_genre_books(
         self, genre: str, all_books: List[Dict], books_to_display: int, state_key: str
     ) -> None:
         """Display books in a grid with Load More button"""
-        from ..Components import modern_book_card
-
         books_shown = all_books[:books_to_display]
         has_more_books = len(all_books) > books_to_display
 
@@ -456,12 +628,10 @@ class HomePage:
 
         # Display books grid
         if books_shown:
-            st.markdown('<div class="book-grid">', unsafe_allow_html=True)
-            cols = st.columns(6)
+            col_cycle = itertools.cycle(st.columns(6))
             for idx, book in enumerate(books_shown):
-                with cols[idx % 6]:
+                with next(col_cycle):
                     modern_book_card.render(book, f"all_{genre}_{idx}")
-            st.markdown('</div>', unsafe_allow_html=True)
 
             # Show Load More button
             not_at_limit = books_to_display < Config.MAX_BOOKS_PER_GENRE
@@ -469,97 +639,53 @@ class HomePage:
                 st.markdown('<div style="margin-top: -8px;"></div>', unsafe_allow_html=True)
                 if st.button(f"📚 Load More {genre}", key=f"load_more_all_{genre}", type="primary"):
                     st.session_state[state_key] += Config.BOOKS_PER_LOAD_MORE
-                    st.rerun()
+                    st.rerun(scope="fragment")
         else:
             st.info(f"No {genre} books found")
 
     def _store_books_in_session(self, books: List[Dict]) -> None:
-        """Store books in session state for detail page access"""
+        """Store books in session state for detail page access (once per distinct batch)"""
         if "all_books" not in st.session_state:
             st.session_state.all_books = {}
 
+        # Reruns redisplay the same cached list; skip rewriting it into all_books
+        batch_hash = hash(tuple(_book_key(book) for book in books))
+        stored_hashes = st.session_state.setdefault("_stored_hashes", set())
+        if batch_hash in stored_hashes:
+            return
+        stored_hashes.add(batch_hash)
+
         for book in books:
-            book_id = book.get("id") or f"{book.get('title', '')}_{book.get('author', '')}"
-            if book_id:
-                st.session_state.all_books[book_id] = book
+            st.session_state.all_books[_book_key(book)] = book
 
     def _initialize_single_genre_state(self, genre: str) -> None:
         """Initialize session state for single genre view"""
-        if f"genre_page_{genre}" not in st.session_state:
-            st.session_state[f"genre_page_{genre}"] = 0
+        page_key = self._page_key(genre)
+        if page_key not in st.session_state:
+            st.session_state[page_key] = 0
 
     def _fetch_single_genre_books(self, genre: str, books_cache_key: str) -> List[Dict]:
         """Fetch and cache books for a single genre"""
-        from ..App_Pro import cached_search_books
-
         # Use cached books if available
         if books_cache_key in st.session_state:
             return st.session_state[books_cache_key]
 
-        # First time - fetch and shuffle books
-        random.seed(hash(genre + st.session_state.cache_key))
-        random_start = random.randint(0, 10)
-
-        all_valid_books = []
-        existing_ids = set()
-        target_books = 50
-        start_index = random_start
-        fetch_count = 0
-        max_total_fetches = 30
-        consecutive_empty = 0
-
-        # Fetch books with pagination
-        while len(all_valid_books) < target_books and fetch_count < max_total_fetches:
-            books = cached_search_books(
-                f"subject:{genre}",
-                max_results=40,
-                start_index=start_index,
-                cache_key=st.session_state.cache_key,
-                verify_genre=False,
-                expected_genre=genre
-            )
-
-            fetch_count += 1
-
-            if not books:
-                consecutive_empty += 1
-                if consecutive_empty >= 3:
-                    start_index = 0
-                    consecutive_empty = 0
-                else:
-                    start_index = random.randint(0, 100)
-                continue
-
-            consecutive_empty = 0
-
-            # Add unique books
-            for book in books:
-                book_id = book.get("id") or f"{book.get('title', '')}_{book.get('author', '')}"
-                if book_id and book_id not in existing_ids:
-                    all_valid_books.append(book)
-                    existing_ids.add(book_id)
-
-                    if len(all_valid_books) >= target_books:
-                        break
-
-            start_index += 80
-
-        # Shuffle and cache
-        random.shuffle(all_valid_books)
+        # First time - take the shared catalog and give this session its own order
+        catalog = _fetch_genre_catalog(genre)
+        all_valid_books = self._genre_rng(genre).sample(catalog, len(catalog))
         st.session_state[books_cache_key] = all_valid_books
         logger.info(f"Cached shuffled books for [{genre}]: {len(all_valid_books)} books")
 
         return all_valid_books
 
+    @st.fragment
     def _render_single_genre(self, genre: str) -> None:
-        """Render books from a single genre with load more - start with 12, add 6 each time"""
-        from ..Components import modern_book_card
+        """
+        Render books from a single genre with load more - start with 12, add 6 each time
 
-        st.markdown(f"""
-        <div class="section-header">
-            {self._get_genre_emoji(genre)} {genre.upper()}
-        </div>
-        """, unsafe_allow_html=True)
+        Runs as a fragment so Load More reruns only this grid, not the whole page.
+        """
+        st.markdown(self._section_header_html(genre), unsafe_allow_html=True)
 
         # Initialize state
         self._initialize_single_genre_state(genre)
@@ -569,7 +695,8 @@ class HomePage:
 
         try:
             # Calculate how many books to show (start with 12, add 6 per click)
-            page = st.session_state[f"genre_page_{genre}"]
+            page_key = self._page_key(genre)
+            page = st.session_state[page_key]
             books_to_display = 12 + (page * 6)  # Initial 12 + 6 per load more click
 
             # Fetch books (uses cache if available)
@@ -581,19 +708,20 @@ class HomePage:
 
                 # CRITICAL: Store ALL books in session state BEFORE rendering
                 # This ensures they're available when user clicks (before cards render)
-                if "all_books" not in st.session_state:
-                    st.session_state.all_books = {}
-                for book in all_valid_books:  # Store ALL fetched books, not just shown ones
-                    book_id = book.get("id") or f"{book.get('title', '')}_{book.get('author', '')}"
-                    if book_id:
-                        st.session_state.all_books[book_id] = book
-
-                st.markdown('<div class="book-grid">', unsafe_allow_html=True)
-                cols = st.columns(6)
-                for idx, book in enumerate(books_shown):
-                    with cols[idx % 6]:
-                        modern_book_card.render(book, f"{genre}_single_{idx}")
-                st.markdown('</div>', unsafe_allow_html=True)
+                # Store ALL fetched books, not just shown ones, in one session state write
+                new_books = {_book_key(book): book for book in all_valid_books}
+                st.session_state.all_books = {**st.session_state.get("all_books", {}), **new_books}
+
+                # Card HTML is built per Load More segment and kept in session state,
+                # so a click only renders the newly revealed books
+                segments = st.session_state.setdefault(f"rendered_{genre}", [])
+                rendered_count = segments[-1][0] if segments else 0
+                if rendered_count < len(books_shown):
+                    segments.append((len(books_shown), modern_book_card.render_to_html(
+                        books_shown[rendered_count:], f"{genre}_single_{rendered_count}"
+                    )))
+                grid_html = "".join(html for end, html in segments if end <= books_to_display)
+                st.markdown(f'<div class="book-grid">{grid_html}</div>', unsafe_allow_html=True)
 
                 # Show load more button if there are more books available
                 has_more_books = len(all_valid_books) > books_to_display
@@ -602,29 +730,32 @@ class HomePage:
                 if has_more_books and not_at_limit:
                     st.markdown('<div style="margin-top: -8px;"></div>', unsafe_allow_html=True)
                     if st.button(f"📚 Load More", key=f"load_more_{genre}", type="primary"):
-                        st.session_state[f"genre_page_{genre}"] += 1
-                        st.rerun()
+                        st.session_state[page_key] += 1
+                        st.rerun(scope="fragment")
                 elif not has_more_books and len(books_shown) < books_to_display:
-                    st.info(f"Found {len(books_shown)} {genre} books with covers (tried {fetch_count} fetches)")
+                    st.info(f"Found {len(books_shown)} {genre} books with covers")
             else:
-                st.info(f"No {genre} books found (tried {fetch_count} fetches)")
+                st.info(f"No {genre} books found")
 
         except Exception as e:
             st.error(f"Could not load {genre} books: {str(e)}")
 
-    @staticmethod
-    def _get_genre_emoji(genre: str) -> str:
+    @classmethod
+    def _page_key(cls, genre: str) -> str:
+        """Session state key for a genre's page count, formatted once per genre"""
+        return cls._PAGE_KEY_CACHE.get(genre) or cls._PAGE_KEY_CACHE.setdefault(genre, f"genre_page_{genre}")
+
+    @classmethod
+    def _section_header_html(cls, genre: str) -> str:
+        """Section header markup for a genre, built once per genre"""
+        html = cls._HEADER_CACHE.get(genre)
+        if html is None:
+            html = cls._HEADER_CACHE[genre] = (
+                f'<div class="section-header">{cls._get_genre_emoji(genre)} {genre.upper()}</div>'
+            )
+        return html
+
+    @classmethod
+    def _get_genre_emoji(cls, genre: str) -> str:
         """Get emoji for genre"""
-        emoji_map = {
-            "Fiction": "📚",
-            "Thriller": "⚡",
-            "Mystery": "🔍",
-            "Fantasy": "🐉",
-            "Romance": "💖",
-            "Horror": "🎃",
-            "Biography": "👤",
-            "History": "📜",
-            "Self-Help": "💡",
-            "Poetry": "✍️"
-        }
-        return emoji_map.get(genre, "📖")
+        return cls._GENRE_EMOJI.get(genre, "📖")
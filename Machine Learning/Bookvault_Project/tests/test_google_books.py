@@ -0,0 +1,183 @@
+"""
+Tests for the BookVault Google Books client
+
+This module tests the async search path: caching, 429 backoff,
+timeout retries and request errors, against a fake aiohttp session.
+"""
+
+import asyncio
+import aiohttp
+import pytest
+from unittest.mock import MagicMock
+from Bookvault.apis.google_books import GoogleBooksAPI
+from Bookvault.config import Config
+
+
+class FakeResponse:
+    """Minimal stand-in for an aiohttp response used as an async context manager"""
+
+    def __init__(self, status=200, payload=None):
+        self.status = status
+        self.payload = payload or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(MagicMock(), (), status=self.status)
+
+    async def json(self):
+        return self.payload
+
+
+class FakeSession:
+    """Serves one outcome (FakeResponse or exception) per get() call"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def get(self, url, params=None):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def api():
+    """
+    Provide a GoogleBooksAPI backed by an empty mock cache
+
+    Returns:
+        GoogleBooksAPI: Client whose cache misses by default
+    """
+    cache = MagicMock()
+    cache.get.return_value = None
+    return GoogleBooksAPI(cache)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """
+    Record asyncio.sleep delays instead of waiting
+
+    Returns:
+        list: Delays passed to asyncio.sleep, in call order
+    """
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
+
+
+class TestParseItems:
+    """Test suite for turning API items into book dicts"""
+
+    def test_parse_items_keeps_books_with_covers(self, mock_google_api_response):
+        """Test items with a cover image become book dicts"""
+        books = GoogleBooksAPI._parse_items(mock_google_api_response["items"])
+
+        assert [book["id"] for book in books] == ["test_book_1", "test_book_2"]
+        assert books[0]["author"] == "Test Author"
+        assert books[0]["cover_url"] == "https://example.com/cover1.jpg&zoom=2"
+
+    def test_parse_items_drops_books_without_covers(self):
+        """Test items without a cover image are skipped"""
+        items = [{"id": "no_cover", "volumeInfo": {"title": "No Cover"}}]
+        assert GoogleBooksAPI._parse_items(items) == []
+
+
+class TestAsyncSearch:
+    """Test suite for GoogleBooksAPI.async_search"""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_request(self, api):
+        """Test cached results are returned without calling the API"""
+        api.cache.get.return_value = [{"id": "cached"}]
+        session = FakeSession()
+
+        books = await api.async_search(session, "dune")
+
+        assert books == [{"id": "cached"}]
+        assert session.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_success_parses_and_caches(self, api, mock_google_api_response):
+        """Test a successful response is parsed and written to the cache"""
+        session = FakeSession(FakeResponse(payload=mock_google_api_response))
+
+        books = await api.async_search(session, "dune", max_results=10)
+
+        assert len(books) == 2
+        api.cache.set.assert_called_once_with("search:dune:en:10:0", books)
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_backs_off_then_succeeds(self, api, sleeps, mock_google_api_response):
+        """Test 429 responses are retried with exponential backoff"""
+        if Config.MAX_RETRIES < 3:
+            pytest.skip("needs at least 3 attempts")
+        session = FakeSession(
+            FakeResponse(status=429),
+            FakeResponse(status=429),
+            FakeResponse(payload=mock_google_api_response),
+        )
+
+        books = await api.async_search(session, "dune")
+
+        assert len(books) == 2
+        assert sleeps == [2, 4]
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_gives_up(self, api, sleeps):
+        """Test the search returns no books once every attempt was rate limited"""
+        session = FakeSession(*(FakeResponse(status=429) for _ in range(Config.MAX_RETRIES)))
+
+        assert await api.async_search(session, "dune") == []
+        assert session.calls == Config.MAX_RETRIES
+        assert len(sleeps) == Config.MAX_RETRIES - 1
+        api.cache.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_retried(self, api, sleeps, mock_google_api_response):
+        """Test a timeout is retried after a short pause"""
+        session = FakeSession(asyncio.TimeoutError(), FakeResponse(payload=mock_google_api_response))
+
+        books = await api.async_search(session, "dune")
+
+        assert len(books) == 2
+        assert sleeps == [1]
+
+    @pytest.mark.asyncio
+    async def test_timeout_gives_up(self, api, sleeps):
+        """Test the search returns no books after timing out on every attempt"""
+        session = FakeSession(*(asyncio.TimeoutError() for _ in range(Config.MAX_RETRIES)))
+
+        assert await api.async_search(session, "dune") == []
+        assert session.calls == Config.MAX_RETRIES
+
+    @pytest.mark.asyncio
+    async def test_client_error_returns_empty(self, api, sleeps):
+        """Test request errors are not retried"""
+        session = FakeSession(aiohttp.ClientConnectionError("refused"))
+
+        assert await api.async_search(session, "dune") == []
+        assert session.calls == 1
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_http_error_returns_empty(self, api, sleeps):
+        """Test non-429 HTTP errors are not retried"""
+        session = FakeSession(FakeResponse(status=500))
+
+        assert await api.async_search(session, "dune") == []
+        assert session.calls == 1
+        api.cache.set.assert_not_called()
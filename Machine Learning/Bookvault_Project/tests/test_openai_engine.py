@@ -0,0 +1,147 @@
+"""
+Tests for BookVault OpenAI genre verification batches
+
+This module tests parsing verification answers and submitting/polling
+Batch API jobs against a mocked OpenAI client.
+"""
+
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from Bookvault.apis.openai_engine import AIRecommendationEngine, BatchFailedError
+
+
+BOOKS = [
+    {"title": "Dune", "author": "Frank Herbert"},
+    {"title": "Emma", "author": "Jane Austen"},
+    {"title": "Neuromancer", "author": "William Gibson"},
+]
+
+
+@pytest.fixture
+def engine():
+    """
+    Provide an AIRecommendationEngine with a mocked OpenAI client
+
+    Returns:
+        AIRecommendationEngine: Engine whose client is a MagicMock
+    """
+    with patch("Bookvault.apis.openai_engine.OpenAI"):
+        ai_engine = AIRecommendationEngine(MagicMock(), MagicMock())
+    ai_engine.client = MagicMock()
+    return ai_engine
+
+
+def batch_output(content):
+    """Build the JSONL output file of a single-request chat completion batch"""
+    return json.dumps({
+        "custom_id": "genre-Science Fiction",
+        "response": {"body": {"choices": [{"message": {"content": content}}]}}
+    }) + "\n"
+
+
+class TestParseGenreVerification:
+    """Test suite for mapping verification answers back to books"""
+
+    def test_parse_selected_indices(self):
+        """Test 1-based indices select the matching books"""
+        result = AIRecommendationEngine.parse_genre_verification("1,3", BOOKS)
+        assert result == [BOOKS[0], BOOKS[2]]
+
+    def test_parse_ignores_spaces_and_out_of_range(self):
+        """Test spaces are tolerated and indices outside the list are dropped"""
+        result = AIRecommendationEngine.parse_genre_verification(" 3, 0, 7 ", BOOKS)
+        assert result == [BOOKS[2]]
+
+    def test_parse_no_indices(self):
+        """Test an answer without numbers selects no books"""
+        result = AIRecommendationEngine.parse_genre_verification("none", BOOKS)
+        assert result == []
+
+    def test_parse_failure_keeps_all_books(self):
+        """Test an unparseable answer does not reject any books"""
+        result = AIRecommendationEngine.parse_genre_verification(None, BOOKS)
+        assert result == BOOKS
+
+
+class TestSubmitGenreVerificationBatch:
+    """Test suite for queueing genre verification batches"""
+
+    def test_submit_returns_batch_id(self, engine):
+        """Test a successful submission uploads one request and returns the batch ID"""
+        engine.client.files.create.return_value = SimpleNamespace(id="file-1")
+        engine.client.batches.create.return_value = SimpleNamespace(id="batch-1")
+
+        assert engine.submit_genre_verification_batch(BOOKS, "Science Fiction") == "batch-1"
+
+        upload = engine.client.files.create.call_args.kwargs
+        assert upload["purpose"] == "batch"
+        request = json.loads(upload["file"][1].decode())
+        assert request["custom_id"] == "genre-Science Fiction"
+        assert request["url"] == "/v1/chat/completions"
+        assert "'Neuromancer' by William Gibson" in request["body"]["messages"][0]["content"]
+
+        engine.client.batches.create.assert_called_once_with(
+            input_file_id="file-1",
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+    def test_submit_empty_books(self, engine):
+        """Test nothing is submitted without books"""
+        assert engine.submit_genre_verification_batch([], "Fiction") is None
+        engine.client.files.create.assert_not_called()
+
+    def test_submit_failure_returns_none(self, engine):
+        """Test submission errors are swallowed"""
+        engine.client.files.create.side_effect = RuntimeError("upload failed")
+        assert engine.submit_genre_verification_batch(BOOKS, "Fiction") is None
+        engine.client.batches.create.assert_not_called()
+
+
+class TestGetBatchAnswer:
+    """Test suite for polling genre verification batches"""
+
+    def test_completed_batch_answer(self, engine):
+        """Test a completed batch returns the stripped model answer"""
+        engine.client.batches.retrieve.return_value = SimpleNamespace(status="completed", output_file_id="file-out")
+        engine.client.files.content.return_value = SimpleNamespace(text=batch_output(" 1,3 \n"))
+
+        assert engine.get_batch_answer("batch-1") == "1,3"
+        engine.client.files.content.assert_called_once_with("file-out")
+
+    @pytest.mark.parametrize("status", ["validating", "in_progress", "finalizing"])
+    def test_running_batch_returns_none(self, engine, status):
+        """Test a batch that is still running has no answer yet"""
+        engine.client.batches.retrieve.return_value = SimpleNamespace(status=status, output_file_id=None)
+
+        assert engine.get_batch_answer("batch-1") is None
+        engine.client.files.content.assert_not_called()
+
+    @pytest.mark.parametrize("status", ["failed", "expired", "cancelling", "cancelled"])
+    def test_dead_batch_raises(self, engine, status):
+        """Test terminal statuses are reported instead of looking like a running batch"""
+        engine.client.batches.retrieve.return_value = SimpleNamespace(status=status, output_file_id=None)
+
+        with pytest.raises(BatchFailedError):
+            engine.get_batch_answer("batch-1")
+
+    def test_completed_without_output_raises(self, engine):
+        """Test a completed batch whose only request errored never yields an answer"""
+        engine.client.batches.retrieve.return_value = SimpleNamespace(status="completed", output_file_id=None)
+
+        with pytest.raises(BatchFailedError):
+            engine.get_batch_answer("batch-1")
+
+    def test_retrieve_error_returns_none(self, engine):
+        """Test a transient polling error is retried on the next poll"""
+        engine.client.batches.retrieve.side_effect = RuntimeError("connection reset")
+        assert engine.get_batch_answer("batch-1") is None
+
+    def test_malformed_output_returns_none(self, engine):
+        """Test an unreadable output file is treated as no answer"""
+        engine.client.batches.retrieve.return_value = SimpleNamespace(status="completed", output_file_id="file-out")
+        engine.client.files.content.return_value = SimpleNamespace(text="not json\n")
+
+        assert engine.get_batch_answer("batch-1") is None
@@ -0,0 +1,98 @@
+"""
+Tests for BookVault search service
+
+This module tests query preparation shared by the sync and async search
+paths, and the concurrent search fan-out with a mocked Google Books client.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from Bookvault.config import Config
+from Bookvault.service import BookVaultService
+
+
+COVER = "https://example.com/cover.jpg"
+
+
+@pytest.fixture
+def rate_limit_allows():
+    """Let every query through the global search rate limiter"""
+    with patch("Bookvault.service.search_rate_limiter") as limiter:
+        limiter.is_allowed.return_value = (True, None)
+        yield limiter
+
+
+class TestPrepareQuery:
+    """Test suite for BookVaultService._prepare_query"""
+
+    def test_valid_query_is_sanitized(self, rate_limit_allows):
+        """Test a valid query is trimmed and returned"""
+        assert BookVaultService._prepare_query("  Harry Potter  ") == "Harry Potter"
+
+    @pytest.mark.parametrize("query", ["", "a" * 600, "<script>alert(1)</script>", "javascript:void(0)"])
+    def test_invalid_query_is_rejected(self, monkeypatch, rate_limit_allows, query):
+        """Test empty, overlong and dangerous queries are rejected"""
+        monkeypatch.setattr(Config, "ENABLE_INPUT_VALIDATION", True)
+        assert BookVaultService._prepare_query(query) is None
+
+    def test_rate_limited_query_is_rejected(self, monkeypatch, rate_limit_allows):
+        """Test queries over the search rate limit are rejected"""
+        monkeypatch.setattr(Config, "RATE_LIMIT_ENABLED", True)
+        rate_limit_allows.is_allowed.return_value = (False, "Rate limit exceeded")
+
+        assert BookVaultService._prepare_query("Dune") is None
+
+    def test_rate_limit_disabled(self, monkeypatch, rate_limit_allows):
+        """Test the rate limiter is skipped when disabled"""
+        monkeypatch.setattr(Config, "RATE_LIMIT_ENABLED", False)
+        rate_limit_allows.is_allowed.return_value = (False, "Rate limit exceeded")
+
+        assert BookVaultService._prepare_query("Dune") == "Dune"
+        rate_limit_allows.is_allowed.assert_not_called()
+
+
+class TestSearchBooksConcurrently:
+    """Test suite for BookVaultService.search_books_concurrently"""
+
+    @pytest.fixture
+    def service(self):
+        """
+        Provide a BookVaultService without touching the real singleton
+
+        Returns:
+            BookVaultService: Service whose books_api is a MagicMock
+        """
+        service = object.__new__(BookVaultService)
+        service.books_api = MagicMock()
+        return service
+
+    def test_results_follow_query_order(self, service, monkeypatch, rate_limit_allows):
+        """Test results come back per query, in order, filtered to books with covers"""
+        monkeypatch.setattr(Config, "ENABLE_INPUT_VALIDATION", True)
+
+        async def fake_search(session, query, max_results, lang, start_index):
+            return [
+                {"id": f"{query}-{start_index}", "cover_url": COVER},
+                {"id": f"{query}-no-cover", "cover_url": ""},
+            ]
+
+        service.books_api.async_search = AsyncMock(side_effect=fake_search)
+
+        results = service.search_books_concurrently([("dune", 0), ("<script>", 0), ("emma", 20)])
+
+        assert results == [
+            [{"id": "dune-0", "cover_url": COVER}],
+            [],
+            [{"id": "emma-20", "cover_url": COVER}],
+        ]
+        assert service.books_api.async_search.await_count == 2
+
+    def test_failed_query_returns_empty(self, service, rate_limit_allows):
+        """Test one failing search does not sink the others"""
+        service.books_api.async_search = AsyncMock(
+            side_effect=[RuntimeError("boom"), [{"id": "ok", "cover_url": COVER}]]
+        )
+
+        results = service.search_books_concurrently([("dune", 0), ("emma", 0)], concurrency=1)
+
+        assert results == [[], [{"id": "ok", "cover_url": COVER}]]
@@ -1,10 +1,16 @@
+import os
 from tkinter import *
 from tkinter import messagebox
 from attendence import Attendance
 from PIL import Image, ImageTk, ImageDraw
+import pandas as pd
 from math import *
 from datetime import *
 
+# Clock hands only ever sit on half-degree angles, so look sin/cos up by half-degree index
+_SIN = [sin(radians(i * 0.5)) for i in range(720)]
+_COS = [cos(radians(i * 0.5)) for i in range(720)]
+
 
 class Main:
     def __init__(self, root):
@@ -33,6 +39,7 @@ class Main:
         self.hr = None
         self.min_ = None
         self.sec_ = None
+        self.after_id = None
 
         self.root = root
         self.root.geometry('400x550+0+0')
@@ -41,11 +48,15 @@ class Main:
         self.root.resizable(bool(0), bool(0))
         self.root.focus()
 
-        self.new_img = Image.new("RGB", (400, 400), (2, 30, 47))
-        self.lbl_img = Image.open('../Face_Recognition_Attendence_System/images/faces.jpg')
-        self.lbl_img = self.lbl_img.resize((300, 300), Image.Resampling.LANCZOS)
-        self.new_img.paste(self.lbl_img, (50, 50))
-        self.new_img.save('../Face_Recognition_Attendence_System/images/new_img.png')
+        # new_img.png is derived from faces.jpg; only rebuild it when faces.jpg is newer
+        src = '../Face_Recognition_Attendence_System/images/faces.jpg'
+        out = '../Face_Recognition_Attendence_System/images/new_img.png'
+        if not os.path.exists(out) or os.path.getmtime(out) < os.path.getmtime(src):
+            self.new_img = Image.new("RGB", (400, 400), (2, 30, 47))
+            self.lbl_img = Image.open(src)
+            self.lbl_img = self.lbl_img.resize((300, 300), Image.Resampling.LANCZOS)
+            self.new_img.paste(self.lbl_img, (50, 50))
+            self.new_img.save(out)
 
         self.wlc_lbl = Label(self.root, text="\nFace Recognition\n Attendance System", font=("Book Antigua", 20, 'bold'),
                              fg="white", compound=BOTTOM, bg="#081923", bd=0)
@@ -77,26 +88,29 @@ class Main:
     def admin(self):
         def login():
             def search():
-                self.f = open("../Face_Recognition_Attendence_System/venv/att.csv", "r")
-                c = 0
-                b = []
-                for i in range(1, 31):
-                    b.append("Absent")
-
-                for line in self.f:
-                    self.x = line.split(" ")
-                    if self.x[0] == self.id_entry.get():
-                        self.l1 = Label(self.report, text=self.x[0] + " " + self.x[1] + " " + self.x[2] + " ",
-                                        bg="#081923", fg='ghostwhite')
-                        m = self.x[2].split("-")
-                        for i in range(0, 30):
-                            if i == int(m[2]):
-                                b[i] = "Pres"
-                        self.l1.grid(row=c + 2, column=0)
-                        c += 1
+                # att.csv lines are "<id> <name> <yyyy-mm-dd> " (note the trailing space)
+                columns = ["id", "name", "date", "_"]
+                try:
+                    df = pd.read_csv("../Face_Recognition_Attendence_System/venv/att.csv", sep=" ", header=None,
+                                     names=columns, dtype=str, on_bad_lines="skip")
+                except (FileNotFoundError, pd.errors.EmptyDataError):
+                    # No attendance recorded yet
+                    df = pd.DataFrame(columns=columns, dtype=str)
+                matches = df[df["id"] == self.id_entry.get()]
+
+                for c, row in enumerate(matches.itertuples(index=False)):
+                    self.l1 = Label(self.report, text=row.id + " " + row.name + " " + row.date + " ",
+                                    bg="#081923", fg='ghostwhite')
+                    self.l1.grid(row=c + 2, column=0)
+
+                # b[day] is "Pres" for every day of the month the ID was marked present
+                present_days = set(matches["date"].str.split("-").str[2].astype(int))
+                b = ["Pres" if i in present_days else "Absent" for i in range(30)]
                 c1 = 0
                 c2 = 0
                 self.t = Toplevel()
+                # Keep the window unmapped while the 29 day labels are gridded: one layout pass at the end
+                self.t.withdraw()
                 for i in range(1, 30):
                     if b[i] == "Absent":
                         c1 = c1 + 1
@@ -106,6 +120,7 @@ class Main:
                         self.l = Label(self.t, text=str(i) + " " + str(b[i]) + " ", fg="blue")
 
                     self.l.grid(row=i, column=0)
+                self.t.deiconify()
                 # print(c1, c2)
 
             if self.username.get() == 'Admin' and self.password_entry.get() == 'Root':
@@ -122,7 +137,7 @@ class Main:
                 self.id_entry.grid(row=0, column=1)
                 self.go_button = Button(self.report, text="Go", width=10, command=search, bg='ghostwhite')
                 self.go_button.grid(row=0, column=2)
-                self.login_frame.destroy()
+                close_login()
 
             elif self.username.get() != 'Admin' and self.password_entry.get() != 'Root':
                 messagebox.showerror("invalid", "invalid username and password")
@@ -132,25 +147,23 @@ class Main:
                 messagebox.showerror("invalid", "invalid username ")
 
         def clock_image(hr, min_, sec_):
-            self.clock = Image.new("RGB", (400, 400), (8, 25, 35))
+            # =====Start from the pre-rendered clock face, only the hands change
+            self.clock = self.bg.copy()
             self.draw = ImageDraw.Draw(self.clock)
-            # =====For Clock Image
-            self.bg = Image.open("../Face_Recognition_Attendence_System/images/c.png")
-            self.bg = self.bg.resize((300, 300), Image.Resampling.LANCZOS)
-            self.clock.paste(self.bg, (50, 50))
 
             self.origin = 200, 200
+            hr, min_, sec_ = round(hr * 2) % 720, round(min_ * 2) % 720, round(sec_ * 2) % 720
             # ====Hour Line Image====
-            self.draw.line((self.origin, 200 + 50 * sin(radians(hr)), 200 - 50 * cos(radians(hr))), fill="#DF005E",
+            self.draw.line((self.origin, 200 + 50 * _SIN[hr], 200 - 50 * _COS[hr]), fill="#DF005E",
                            width=4)
             # ====Min Line Image====
-            self.draw.line((self.origin, 200 + 80 * sin(radians(min_)), 200 - 80 * cos(radians(min_))), fill="white",
+            self.draw.line((self.origin, 200 + 80 * _SIN[min_], 200 - 80 * _COS[min_]), fill="white",
                            width=3)
             # ====Sec Line Image====
-            self.draw.line((self.origin, 200 + 80 * sin(radians(sec_)), 200 - 100 * cos(radians(sec_))), fill="yellow",
+            self.draw.line((self.origin, 200 + 80 * _SIN[sec_], 200 - 100 * _COS[sec_]), fill="yellow",
                            width=2)
             self.draw.ellipse((195, 195, 210, 210), fill="#1AD5D5")
-            self.clock.save("clock.png")
+            return self.clock
 
         def working():
             self.h = datetime.now().time().hour
@@ -159,12 +172,20 @@ class Main:
             self.hr = (self.h / 12) * 360
             self.min_ = (self.m / 60) * 360
             self.sec_ = (self.s / 60) * 360
-            clock_image(self.hr, self.min_, self.sec_)
-            self.img = ImageTk.PhotoImage(file="clock.png")
+            # Hand the PIL image straight to Tk instead of round-tripping through clock.png
+            self.img = ImageTk.PhotoImage(clock_image(self.hr, self.min_, self.sec_))
             self.clock_label.config(image=self.img)
-            self.clock_label.after(200, working)
+            self.after_id = self.clock_label.after(200, working)
+
+        def close_login():
+            # Stop the clock before the window goes, otherwise the 200ms tick keeps drawing forever
+            if self.after_id is not None:
+                self.clock_label.after_cancel(self.after_id)
+                self.after_id = None
+            self.login_frame.destroy()
 
         self.login_frame = Toplevel()
+        self.login_frame.protocol("WM_DELETE_WINDOW", close_login)
         self.login_frame.title("Login")
         self.login_frame.geometry("1350x700+0+0")
         self.login_frame.config(bg="#021e2f")
@@ -209,6 +230,11 @@ class Main:
                                  compound=BOTTOM, bg="#081923", bd=0)
         self.clock_label.place(x=90, y=120, height=450, width=350)
 
+        # =====Clock face is static: decode and resize it once, not on every tick
+        self.bg = Image.new("RGB", (400, 400), (8, 25, 35))
+        self.bg.paste(Image.open("../Face_Recognition_Attendence_System/images/c.png").resize(
+            (300, 300), Image.Resampling.LANCZOS), (50, 50))
+
         working()
 
         self.copyWrite = Text(self.login_frame_1, foreground='#800857', background='white',
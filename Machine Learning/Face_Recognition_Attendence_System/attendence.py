@@ -1,24 +1,48 @@
-import datetime
 import time
 import tkinter as tk
 import cv2
 import numpy as np
 import os
 import pandas as pd
-from PIL import Image
-
+from concurrent.futures import ThreadPoolExecutor
+
+cv2.setUseOptimized(True)
+cv2.setNumThreads(max(1, os.cpu_count() or 1))
+# lets UMat work run on an OpenCL device (e.g. an integrated GPU); a no-op without one
+cv2.ocl.setUseOpenCL(True)
+
+# TakeImages grabs every webcam frame but only decodes one in this many as a
+# sample, which also keeps consecutive samples from being near-duplicates
+TAKE_RETRIEVE_EVERY = 2
+# TrackImages grabs every webcam frame but only decodes and scans one in this many
+TRACK_RETRIEVE_EVERY = 3
+# of those decoded frames, only one in this many is run through detection and
+# recognition; the rest reuse the last boxes, giving ~5 detections/s at 30 FPS
+TRACK_DETECT_EVERY = 2
+# frames wider than this are shrunk before the Haar cascade scans them
+DETECT_WIDTH = 640
+# face sizes the cascade looks for, in downscaled pixels; bounds the scale pyramid
+MIN_FACE = (60, 60)
+MAX_FACE = (400, 400)
+# every training sample is saved at, and loaded back as, this shape
+SAMPLE_SIZE = (500, 500)
+# roster mapping student IDs to names
+STUDENT_DETAILS = "../Face_Recognition_Attendence_System/StudentDetails/StudentDetails.csv"
+# running "id name date" log of days each student was marked present
+ATT_FILE = "../Face_Recognition_Attendence_System/venv/att.csv"
+# crops of faces the recognizer could not place, saved as Image<n>.jpg
+UNKNOWN_DIR = "../Face_Recognition_Attendence_System/ImagesUnknown"
+# pumps HighGUI events without waitKey's 1ms sleep (OpenCV 4.5.3+)
+pollKey = getattr(cv2, "pollKey", lambda: cv2.waitKey(1))
 
 
 class Attendance:
     def __init__(self, root):
         self.imageNp = None
-        self.pilImage = None
         self.Ids = None
         self.faces = None
         self.TrainingImagePath = None
         self.imagePaths = None
-        self.detector = None
-        self.harcascadePath = None
         self.recognizer = None
         self.face = None
         self.count = None
@@ -27,6 +51,21 @@ class Attendance:
         self.Id = None
         self.data = 0
 
+        # loaded once here so each button press reuses the parsed cascade and roster
+        self.harcascadePath = \
+            "../Face_Recognition_Attendence_System/venv/Lib/site-packages/cv2/data/haarcascade_frontalface_default.xml"
+        self.faceCascade = cv2.CascadeClassifier(self.harcascadePath)
+        self.df = None
+        self.id_to_name = None
+        if os.path.exists(STUDENT_DETAILS):
+            self.loadStudents()
+        # next Image<n>.jpg number is tracked here rather than re-listing the folder per face
+        self.unknown_idx = len(os.listdir(UNKNOWN_DIR)) if os.path.isdir(UNKNOWN_DIR) else 0
+        self.att_seen_file = set()
+        if os.path.exists(ATT_FILE):
+            with open(ATT_FILE) as f:
+                self.att_seen_file = {(x[0], x[2]) for x in (line.split(" ") for line in f) if len(x) > 2}
+
         self.window = root
         self.window.title("Attendance System")
         self.window.geometry('350x180')
@@ -78,64 +117,69 @@ class Attendance:
         self.res = ""
         self.message.configure(text=self.res)
 
-    def is_number(self, s):
-        try:
-            float(s)
-            return True
-        except ValueError:
-            pass
-
-        try:
-            import unicodedata
-            unicodedata.numeric(s)
-            return True
-        except (TypeError, ValueError):
-            pass
+    def loadStudents(self):
+        self.df = pd.read_csv(STUDENT_DETAILS)
+        # O(1) name lookup per recognised face instead of a boolean mask over the roster
+        self.id_to_name = dict(zip(self.df['ID'].astype(int), self.df['Name']))
 
-        return False
+    def is_number(self, s):
+        # IDs end up as int labels for the recognizer, so only whole numbers are accepted
+        return s.isdigit() or (s[:1] in ('+', '-') and s[1:].isdigit())
+
+    def detectFaces(self, classifier, gray, scaleFactor, width=None):
+        # a UMat has no shape, so callers passing one give the frame width
+        scale = min(1.0, DETECT_WIDTH / (width or gray.shape[1]))
+        if scale < 1.0:
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        faces = classifier.detectMultiScale(gray, scaleFactor, 5, minSize=MIN_FACE, maxSize=MAX_FACE)
+        if len(faces) == 0 or scale == 1.0:
+            return faces
+        # map the boxes back onto the full-resolution frame
+        return (faces / scale).astype(int)
 
     def TakeImages(self):
         self.Id = (self.txt1.get())
         if self.is_number(self.Id):
-            face_classifier = cv2.CascadeClassifier(
-                '../Face_Recognition_Attendence_System/venv/Lib/site-packages/cv2/data/haarcascade_frontalface_default.xml')
-
             def face_extractor(img):
                 self.cropped_face = None
                 self.gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-                self.faces = face_classifier.detectMultiScale(self.gray, 1.3, 5)
+                self.faces = self.detectFaces(self.faceCascade, self.gray, 1.3)
 
-                if self.faces is ():
+                if len(self.faces) == 0:
                     return None
 
                 for (x, y, w, h) in self.faces:
-                    self.cropped_face = img[y:y + h, x:x + w]
+                    self.cropped_face = self.gray[y:y + h, x:x + w]
 
                 return self.cropped_face
 
             self.cap = cv2.VideoCapture(0)
             self.count = 0
+            self.frameNo = 0
 
             while True:
-                ret, frame = self.cap.read()
-                if face_extractor(frame) is not None:
-                    self.count += 1
-                    self.face = cv2.resize(face_extractor(frame), (500, 500))
-                    self.face = cv2.cvtColor(self.face, cv2.COLOR_BGR2GRAY)
+                self.cap.grab()
+                if self.frameNo % TAKE_RETRIEVE_EVERY == 0:
+                    ret, frame = self.cap.retrieve()
+                    face = face_extractor(frame)
+                    if face is not None:
+                        self.count += 1
+                        self.face = cv2.resize(face, SAMPLE_SIZE)
 
-                    file_name_path = "../Face_Recognition_Attendence_System/TrainingImage/Train.User." + self.Id + '.' + \
-                                     str(self.count) + ".jpg"
-                    cv2.imwrite(file_name_path, self.face)
+                        file_name_path = "../Face_Recognition_Attendence_System/TrainingImage/Train.User." + self.Id + '.' + \
+                                         str(self.count) + ".jpg"
+                        cv2.imwrite(file_name_path, self.face)
 
-                    cv2.putText(self.face, str(self.count), (50, 50), cv2.FONT_HERSHEY_COMPLEX, 1, (0, 255, 0), 2)
+                        cv2.putText(self.face, str(self.count), (50, 50), cv2.FONT_HERSHEY_COMPLEX, 1, (0, 255, 0), 2)
 
-                    cv2.imshow('Face cropper', self.face)
-                    print("FACE FOUND")
+                        cv2.imshow('Face cropper', self.face)
+                        print("FACE FOUND")
 
-                else:
-                    print("Face not Found")
-                    pass
+                    else:
+                        print("Face not Found")
+                        pass
 
+                self.frameNo += 1
                 if cv2.waitKey(1) == 13 or self.count == 100:
                     break
 
@@ -150,14 +194,13 @@ class Attendance:
             self.message.configure(text=res)
 
     def TrainImages(self):
-        self.recognizer = cv2.face.LBPHFaceRecognizer_create()
-        self.harcascadePath = \
-            "../Face_Recognition_Attendence_System/venv/Lib/site-packages/cv2/data/haarcascade_frontalface_default.xml"
-        self.detector = cv2.CascadeClassifier(self.harcascadePath)
+        recognizer = cv2.face.LBPHFaceRecognizer_create()
         self.TrainingImagePath = '../Face_Recognition_Attendence_System/TrainingImage'
         self.faces, self.Ids = self.getImagesAndLabels(self.TrainingImagePath)
-        self.recognizer.train(self.faces, np.array(self.Ids))
-        self.recognizer.write("../Face_Recognition_Attendence_System/TrainingImageLabel/Trainner.yml")
+        recognizer.train(self.faces, self.Ids)
+        recognizer.write("../Face_Recognition_Attendence_System/TrainingImageLabel/Trainner.yml")
+        # only a model that trained and saved is kept for TrackImages to reuse
+        self.recognizer = recognizer
         res = "Image Trained"
         self.message.configure(text=res)
 
@@ -165,87 +208,92 @@ class Attendance:
         self.imagePaths = [os.path.join(path, f) for f in os.listdir(path)]
         print(self.imagePaths)
 
-        self.faces = []
-
-        self.Ids = []
-
-        for imagePath in self.imagePaths:
-            self.pilImage = Image.open(imagePath).convert('L')
-
-            self.imageNp = np.array(self.pilImage, 'uint8')
+        # imread releases the GIL while decoding, so the files load in parallel
+        def _load(imagePath):
+            img = cv2.imread(imagePath, cv2.IMREAD_GRAYSCALE)
+            if img is not None and img.shape[::-1] != SAMPLE_SIZE:
+                img = cv2.resize(img, SAMPLE_SIZE)
+            return img, int(os.path.split(imagePath)[-1].split(".")[2])
 
-            self.Id = int(os.path.split(imagePath)[-1].split(".")[2])
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            results = [r for r in ex.map(_load, self.imagePaths) if r[0] is not None]
 
-            self.faces.append(self.imageNp)
-            self.Ids.append(self.Id)
+        self.faces = [img for img, _ in results]
+        self.Ids = np.asarray([Id for _, Id in results], dtype=np.int32)
         return self.faces, self.Ids
 
     def TrackImages(self):
-        self.recognizer = cv2.face.LBPHFaceRecognizer_create()
-        self.recognizer.read("../Face_Recognition_Attendence_System/TrainingImageLabel/Trainner.yml")
-        self.harcascadePath = \
-            "../Face_Recognition_Attendence_System/venv/Lib/site-packages/cv2/data/haarcascade_frontalface_default.xml"
-        self.faceCascade = cv2.CascadeClassifier(self.harcascadePath)
-        self.df = pd.read_csv("../Face_Recognition_Attendence_System/StudentDetails/StudentDetails.csv")
+        # a model trained this session is already in memory; otherwise load the saved one
+        if self.recognizer is None:
+            self.recognizer = cv2.face.LBPHFaceRecognizer_create()
+            self.recognizer.read("../Face_Recognition_Attendence_System/TrainingImageLabel/Trainner.yml")
+        if self.df is None:
+            self.loadStudents()
         self.cam = cv2.VideoCapture(0)
         self.font = cv2.FONT_HERSHEY_SIMPLEX
         self.col_names = ['ID', 'Date', 'Time']
-        self.attendance = pd.DataFrame(columns=self.col_names)
+        # one row per recognised ID; the DataFrame is only built once tracking stops
+        self.att_rows = []
+        self.att_seen = set()
+        self.frameNo = 0
+        # (x, y, w, h, label) from the last detection pass, redrawn on skipped frames
+        self.tracked = []
         while True:
-            self.ret, self.im = self.cam.read()
-            self.gray = cv2.cvtColor(self.im, cv2.COLOR_BGR2GRAY)
-            self.faces = self.faceCascade.detectMultiScale(self.gray, 1.2, 5)
-            for (x, y, w, h) in self.faces:
-                cv2.rectangle(self.im, (x, y), (x + w, y + h), (225, 0, 0), 2)
-                self.Id, self.conf = self.recognizer.predict(self.gray[y:y + h, x:x + w])
-                if self.conf < 50:
-                    ts = time.time()
-                    date = datetime.datetime.fromtimestamp(ts).strftime('%Y-%m-%d')
-                    timeStamp = datetime.datetime.fromtimestamp(ts).strftime('%H:%M:%S')
-                    self.attendance.loc[len(self.attendance)] = [self.Id, date, timeStamp]
-                    aa = self.df.loc[self.df['ID'] == self.Id]['Name'].values
-                    tt = str(self.Id) + "-" + aa[0]
-                    print(str(self.Id) + " " + aa[0])
-
-                    count = 0
-                    # insert into attendence values(%s,%s,%s)
-                    val = (id, aa[0], date)
-                else:
-                    Id = 'Unknown'
-                    tt = str(Id)
-                if self.conf > 75:
-                    noOfFile = len(os.listdir("../Face_Recognition_Attendence_System/ImagesUnknown")) + 1
-                    cv2.imwrite("../Face_Recognition_Attendence_System/ImagesUnknown/Image" + str(noOfFile) + ".jpg",
-                                self.im[y:y + h, x:x + w])
-                cv2.putText(self.im, str(tt), (x, y + h), self.font, 1, (255, 255, 255), 2)
-            self.attendance = self.attendance.drop_duplicates(keep='first', subset=['ID'])
-            cv2.imshow('im', self.im)
+            self.ret = self.cam.grab()
+            if self.frameNo % TRACK_RETRIEVE_EVERY == 0:
+                self.ret, self.im = self.cam.retrieve()
+                if self.frameNo % (TRACK_RETRIEVE_EVERY * TRACK_DETECT_EVERY) == 0:
+                    # convert, shrink and scan on the T-API; only the recognizer needs host memory
+                    ugray = cv2.cvtColor(cv2.UMat(self.im), cv2.COLOR_BGR2GRAY)
+                    self.faces = self.detectFaces(self.faceCascade, ugray, 1.3, self.im.shape[1])
+                    self.gray = ugray.get()
+                    self.tracked = []
+                    for (x, y, w, h) in self.faces:
+                        self.Id, self.conf = self.recognizer.predict(self.gray[y:y + h, x:x + w])
+                        if self.conf < 50:
+                            # the timestamp is only needed the first time an ID is seen
+                            if self.Id not in self.att_seen:
+                                date, timeStamp = time.strftime('%Y-%m-%d %H:%M:%S').split(' ')
+                                self.att_seen.add(self.Id)
+                                self.att_rows.append((self.Id, date, timeStamp))
+                            name = self.id_to_name.get(self.Id, 'Unknown')
+                            tt = str(self.Id) + "-" + name
+                            print(str(self.Id) + " " + name)
+
+                            count = 0
+                            # insert into attendence values(%s,%s,%s)
+                            val = (id, name, date)
+                        else:
+                            Id = 'Unknown'
+                            tt = str(Id)
+                        if self.conf > 75:
+                            self.unknown_idx += 1
+                            cv2.imwrite(UNKNOWN_DIR + "/Image" + str(self.unknown_idx) + ".jpg", self.im[y:y + h, x:x + w])
+                        self.tracked.append((x, y, w, h, str(tt)))
+                for (x, y, w, h, tt) in self.tracked:
+                    cv2.rectangle(self.im, (x, y), (x + w, y + h), (225, 0, 0), 2)
+                    cv2.putText(self.im, tt, (x, y + h), self.font, 1, (255, 255, 255), 2)
+                # the preview only changes when a new frame was decoded, so only redraw then
+                cv2.imshow('im', self.im)
+            self.frameNo += 1
             # global data
-            if cv2.waitKey(1) == ord('q'):
+            if pollKey() == ord('q'):
                 if self.data == 0:
                     self.data = self.data + 1
-                    f = open("../Face_Recognition_Attendence_System/venv/att.csv", "r")
-                    self.count=0
-                    for line in f:
-                        x = line.split(" ")
-
-                        if x[0] == str(self.Id) and str(date)==x[2]:
-                            self.count = self.count + 1
-                    if self.count == 0:
-                        f = open("../Face_Recognition_Attendence_System/venv/att.csv", "a")
-                        f.write(str(self.Id) + " " + aa[0] + " " + str(date) + " \n")
-                        f.close()
-                    print(self.count,x[0] == str(self.Id) , str(date)==x[2])
+                    key = (str(self.Id), str(date))
+                    if key not in self.att_seen_file:
+                        with open(ATT_FILE, "a") as f:
+                            f.write(str(self.Id) + " " + name + " " + str(date) + " \n")
+                        self.att_seen_file.add(key)
                 else:
                     print("error")
                 break
 
-        ts = time.time()
-        date = datetime.datetime.fromtimestamp(ts).strftime('%Y-%m-%d')
-        timeStamp = datetime.datetime.fromtimestamp(ts).strftime('%H:%M:%S')
+        date, timeStamp = time.strftime('%Y-%m-%d %H:%M:%S').split(' ')
         Hour, Minute, Second = timeStamp.split(":")
         fileName = "../Face_Recognition_Attendence_System/Attendance/Attendance_" + date + ".csv"
 
+        self.attendance = pd.DataFrame(self.att_rows, columns=self.col_names)
         self.attendance.to_csv(fileName, index=False)
         self.cam.release()
         cv2.destroyAllWindows()
@@ -6,7 +6,8 @@ import numpy as np
 def faceDetection(test_img):
     gray_img = cv2.cvtColor(test_img, cv2.COLOR_BGR2BGRAY)  # convert color image to grayscale img
     face_haar_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-    faces = face_haar_cascade.detectMultiScale(gray_img, scaleFactor=1.32, minNeighbours=5)
+    faces = face_haar_cascade.detectMultiScale(gray_img, scaleFactor=1.32, minNeighbours=5,
+                                               minSize=(60, 60), maxSize=(400, 400))
     return faces, gray_img
 
 
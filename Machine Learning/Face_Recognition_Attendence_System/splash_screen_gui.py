@@ -1,8 +1,5 @@
 # importing library
-import time
 from tkinter import *
-from Login_Page import Main
-from PIL import ImageTk, Image
 
 w = Tk()
 
@@ -19,6 +16,8 @@ w.overrideredirect(1)
 
 # new window to open
 def new_win():
+    # imported here so PIL, OpenCV and pandas load after the splash is already up
+    from Login_Page import Main
     Main(Tk())
     mainloop()
 
@@ -34,38 +33,31 @@ label2.place(x=10, y=215)
 
 # making animation
 
-image_a = ImageTk.PhotoImage(Image.open('../Face_Recognition_Attendence_System/images/c2.png'))
-image_b = ImageTk.PhotoImage(Image.open('../Face_Recognition_Attendence_System/images/c1.png'))
+# Tk 8.6 reads PNG natively, so the splash itself needs no PIL
+image_a = PhotoImage(file='../Face_Recognition_Attendence_System/images/c2.png')
+image_b = PhotoImage(file='../Face_Recognition_Attendence_System/images/c1.png')
 
-for i in range(5):  # 5loops
-    Label(w, image=image_a, border=0, relief=SUNKEN).place(x=180, y=145)
-    Label(w, image=image_b, border=0, relief=SUNKEN).place(x=200, y=145)
-    Label(w, image=image_b, border=0, relief=SUNKEN).place(x=220, y=145)
-    Label(w, image=image_b, border=0, relief=SUNKEN).place(x=240, y=145)
-    w.update_idletasks()
-    time.sleep(0.5)
+# four dots placed once; each tick moves the highlighted image one dot along
+dots = []
+for x in (180, 200, 220, 240):
+    dot = Label(w, image=image_b, border=0, relief=SUNKEN)
+    dot.place(x=x, y=145)
+    dots.append(dot)
 
-    Label(w, image=image_b, border=0, relief=SUNKEN).place(x=180, y=145)
-    Label(w, image=image_a, border=0, relief=SUNKEN).place(x=200, y=145)
-    Label(w, image=image_b, border=0, relief=SUNKEN).place(x=220, y=145)
-    Label(w, image=image_b, border=0, relief=SUNKEN).place(x=240, y=145)
-    w.update_idletasks()
-    time.sleep(0.5)
+step = 0
 
-    Label(w, image=image_b, border=0, relief=SUNKEN).place(x=180, y=145)
-    Label(w, image=image_b, border=0, relief=SUNKEN).place(x=200, y=145)
-    Label(w, image=image_a, border=0, relief=SUNKEN).place(x=220, y=145)
-    Label(w, image=image_b, border=0, relief=SUNKEN).place(x=240, y=145)
-    w.update_idletasks()
-    time.sleep(0.5)
 
-    Label(w, image=image_b, border=0, relief=SUNKEN).place(x=180, y=145)
-    Label(w, image=image_b, border=0, relief=SUNKEN).place(x=200, y=145)
-    Label(w, image=image_b, border=0, relief=SUNKEN).place(x=220, y=145)
-    Label(w, image=image_a, border=0, relief=SUNKEN).place(x=240, y=145)
-    w.update_idletasks()
-    time.sleep(0.5)
+def tick():
+    global step
+    if step == 5 * len(dots):  # 5loops
+        w.destroy()
+        return
+    for j, dot in enumerate(dots):
+        dot.configure(image=image_a if j == step % len(dots) else image_b)
+    step += 1
+    w.after(500, tick)
 
-w.destroy()
-new_win()
+
+tick()
 w.mainloop()
+new_win()